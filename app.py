@@ -1,18 +1,28 @@
+import asyncio
 import os
-import json
-from io import BytesIO
-
+import hashlib
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
+
+import orjson
+from asgiref.wsgi import WsgiToAsgi
 from flask import Flask, jsonify, redirect, render_template, request, send_file, send_from_directory, url_for
 from werkzeug.utils import secure_filename
 
 from src.api.evaluation_api import load_error_samples, load_metrics
+from src.api.json_provider import OrjsonProvider
 from src.dashboard_utils import (
+    SEVERITIES,
     build_confidence_histogram_data,
     build_executive_summary,
     build_risk_summary,
     current_analysis_timestamp,
     enrich_results,
     generate_risk_report_pdf,
+    load_json_cached,
     load_model_comparison_metrics,
 )
 from src.scoring.risk_score import attach_risk_scores
@@ -21,16 +31,23 @@ from src.scoring.mitigation_strategies import (
     generate_mitigation_strategies,
     generate_executive_mitigation_summary
 )
-from src.explainability import explain_clause_with_shap
-from src.inference import infer_clauses
-from src.pdf_extractor import extract_text_from_pdf
-from src.segmentation import segment_clauses
+from src.inference_config import BERT_MODEL_DIR, QUANTIZE_CPU, TORCH_COMPILE
+from src.inference_worker import explain, explain_batch, extract_and_infer
 
 
 UPLOAD_FOLDER = "uploads"
 ALLOWED_EXTENSIONS = {"pdf"}
+REPORT_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+ARTIFACT_MAX_AGE = 60
+HIGH_CONF_THRESHOLD = 0.85
+PREDICTION_CACHE_DIR = os.path.join("evaluation", "_cache")
+PREDICTION_CACHE_MAX_FILES = 256
+# Bump when extraction, segmentation, or inference output changes so cached
+# predictions from the old pipeline are not served.
+PREDICTION_PIPELINE_VERSION = 1
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
 os.makedirs("evaluation", exist_ok=True)
@@ -40,33 +57,115 @@ def allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
-def analyze_contract(file_path: str) -> dict:
+def safe_upload_path(filename: str) -> Optional[Path]:
+    """Resolve an uploaded file name to its path, or None if it does not exist."""
+    path = Path(app.config["UPLOAD_FOLDER"]) / secure_filename(filename)
+    return path if path.is_file() else None
+
+
+def _attach_mitigations(item: dict) -> dict:
+    """Attach mitigation strategies to a single scored clause."""
+    label = item.get("label", "Neutral")
+    severity = item.get("severity", "None")
+    risk_triggers = item.get("high_risk_detection", {}).get("risk_triggers", [])
+    monetary_value = item.get("extracted_metadata", {}).get("monetary_value", 0.0)
+    durations = item.get("extracted_metadata", {}).get("durations", {})
+
+    item["mitigation_strategies"] = generate_mitigation_strategies(
+        label, severity, risk_triggers, monetary_value, durations
+    )
+    return item
+
+
+@lru_cache(maxsize=1)
+def _prediction_fingerprint() -> str:
+    """Digest of everything besides the PDF bytes that determines the predictions.
+
+    Computed once per process, like the worker's model load.
+    """
+    parts = [
+        f"v{PREDICTION_PIPELINE_VERSION}",
+        f"quantize={QUANTIZE_CPU}",
+        f"compile={TORCH_COMPILE}",
+    ]
+    try:
+        with os.scandir(BERT_MODEL_DIR) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_file():
+                    stat = entry.stat()
+                    parts.append(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}")
+    except OSError:
+        parts.append("no-model")
+    return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _prediction_cache_path(file_hash: str) -> str:
+    return os.path.join(PREDICTION_CACHE_DIR, f"{file_hash}-{_prediction_fingerprint()}.json")
+
+
+def _load_cached_predictions(cache_path: str):
+    """Return persisted clause predictions, or None."""
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "rb") as handle:
+            predictions = orjson.loads(handle.read())["predictions"]
+        # Mark as recently used for eviction
+        os.utime(cache_path)
+        return predictions
+    except (OSError, KeyError, orjson.JSONDecodeError):
+        return None
+
+
+def _evict_cached_predictions() -> None:
+    """Keep the most recently used PREDICTION_CACHE_MAX_FILES entries."""
+    try:
+        with os.scandir(PREDICTION_CACHE_DIR) as entries:
+            cached = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.name.endswith(".json")]
+    except OSError:
+        return
+    if len(cached) <= PREDICTION_CACHE_MAX_FILES:
+        return
+    cached.sort()
+    for _, path in cached[: len(cached) - PREDICTION_CACHE_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _save_cached_predictions(cache_path: str, predictions: list) -> None:
+    """Persist predictions so they survive restarts."""
+    os.makedirs(PREDICTION_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(orjson.dumps({"predictions": predictions}))
+    os.replace(tmp_path, cache_path)
+    _evict_cached_predictions()
+
+
+def analyze_contract(file_path: str, file_hash: str = None) -> dict:
     """Run extraction, segmentation, inference, and summary preparation."""
-    raw_text = extract_text_from_pdf(file_path)
-    clauses = segment_clauses(raw_text)
-    predictions = infer_clauses(clauses)
+    if file_hash is None:
+        file_hash = file_digest(file_path)
+
+    cache_path = _prediction_cache_path(file_hash)
+    predictions = _load_cached_predictions(cache_path)
+    if predictions is None:
+        _, predictions = extract_and_infer(file_path)
+        _save_cached_predictions(cache_path, predictions)
     
     # Use advanced risk scoring (includes IP Risk, financial exposure, confidence calibration)
     scored_results, risk_score_breakdown = attach_advanced_risk_scores(predictions)
     
     # Enrich with mitigation strategies
-    for item in scored_results:
-        label = item.get("label", "Neutral")
-        severity = item.get("severity", "None")
-        risk_triggers = item.get("high_risk_detection", {}).get("risk_triggers", [])
-        monetary_value = item.get("extracted_metadata", {}).get("monetary_value", 0.0)
-        durations = item.get("extracted_metadata", {}).get("durations", {})
-        
-        mitigations = generate_mitigation_strategies(
-            label, severity, risk_triggers, monetary_value, durations
-        )
-        item["mitigation_strategies"] = mitigations
+    scored_results = [_attach_mitigations(item) for item in scored_results]
     
-    enriched_results = enrich_results(scored_results)
-    summary = build_risk_summary(enriched_results)
+    enriched_results, high_items, severity_counts, results_view = enrich_results(scored_results)
+    summary = build_risk_summary(results_view, severity_counts)
     overall_risk_score = float(risk_score_breakdown.get("normalized_score", 0.0))
-    executive_summary = build_executive_summary(enriched_results, summary, overall_risk_score)
-    confidence_histogram = build_confidence_histogram_data(enriched_results, bins=10)
+    executive_summary = build_executive_summary(enriched_results, summary, overall_risk_score, high_items)
+    confidence_histogram = build_confidence_histogram_data(results_view, bins=10)
     model_comparison = load_model_comparison_metrics("evaluation/evaluation_report.json")
     
     # Generate mitigation summary
@@ -74,6 +173,7 @@ def analyze_contract(file_path: str) -> dict:
 
     return {
         "results": enriched_results,
+        "high_items": high_items,
         "summary": summary,
         "overall_risk_score": overall_risk_score,
         "risk_score_breakdown": risk_score_breakdown,
@@ -85,13 +185,85 @@ def analyze_contract(file_path: str) -> dict:
     }
 
 
+def build_chart_payload_json(
+    pie_labels: list,
+    pie_values: list,
+    bar_labels: list,
+    bar_values: list,
+    hist_labels: list,
+    hist_counts: list,
+    high_conf_threshold: float,
+) -> str:
+    """Serialize all chart series into one HTML-safe JSON blob for the results page."""
+    payload = {
+        "pie": {"labels": pie_labels, "values": pie_values},
+        "bar": {"labels": bar_labels, "values": bar_values},
+        "hist": {"labels": hist_labels, "counts": hist_counts},
+        "high_conf_threshold": high_conf_threshold,
+    }
+    encoded = orjson.dumps(payload).decode("utf-8")
+    return encoded.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+
+
+def file_digest(file_path: str) -> str:
+    """Return a short content hash used to key cached analyses."""
+    with open(file_path, "rb") as handle:
+        return hashlib.blake2b(handle.read(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _analyze_by_hash(file_hash: str, file_path: str) -> dict:
+    """Memoized analyze_contract; callers must treat the result as read-only."""
+    return analyze_contract(file_path, file_hash=file_hash)
+
+
+def cached_analysis(file_path: str) -> dict:
+    """Analyze a contract, reusing the result for identical uploaded bytes."""
+    return _analyze_by_hash(file_digest(file_path), file_path)
+
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_EMPTY_HISTOGRAM = build_confidence_histogram_data([], bins=10)
+
+# Template context for the results page when analysis fails; built once and
+# frozen all the way down since every failed request shares it.
+EMPTY_ANALYSIS = _freeze(
+    {
+        "results": [],
+        "summary": build_risk_summary([]),
+        "overall_risk_score": 0,
+        "risk_score_breakdown": attach_advanced_risk_scores([])[1],
+        "executive_summary": [],
+        "model_comparison": {"available": False, "bert_macro_f1": None, "legal_bert_macro_f1": None, "delta": None},
+        "chart_payload_json": build_chart_payload_json(
+            [],
+            [],
+            list(SEVERITIES),
+            [0, 0, 0, 0],
+            _EMPTY_HISTOGRAM["labels"],
+            _EMPTY_HISTOGRAM["counts"],
+            HIGH_CONF_THRESHOLD,
+        ),
+        "high_conf_threshold": HIGH_CONF_THRESHOLD,
+    }
+)
+
+
 @app.route("/", methods=["GET"])
 def index():
     return render_template("index.html")
 
 
 @app.route("/upload", methods=["POST"])
-def upload_file():
+async def upload_file():
     if "file" not in request.files:
         return redirect(url_for("index"))
 
@@ -104,20 +276,21 @@ def upload_file():
 
     filename = secure_filename(file.filename)
     file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-    file.save(file_path)
+    await asyncio.to_thread(file.save, file_path)
 
     return redirect(url_for("result", filename=filename))
 
 
 @app.route("/result/<filename>", methods=["GET"])
-def result(filename: str):
-    filename = secure_filename(filename)
-    file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-    if not os.path.exists(file_path):
+async def result(filename: str):
+    upload_path = safe_upload_path(filename)
+    if upload_path is None:
         return redirect(url_for("index"))
+    filename = upload_path.name
+    file_path = str(upload_path)
 
     try:
-        analysis = analyze_contract(file_path)
+        analysis = await asyncio.to_thread(cached_analysis, file_path)
         analyzed_at = current_analysis_timestamp()
 
         label_distribution = analysis["summary"]["label_counts"]
@@ -126,7 +299,7 @@ def result(filename: str):
         pie_labels = list(label_distribution.keys())
         pie_values = list(label_distribution.values())
 
-        bar_labels = ["High", "Medium", "Low", "None"]
+        bar_labels = list(SEVERITIES)
         bar_values = [severity_distribution.get(level, 0) for level in bar_labels]
 
         return render_template(
@@ -139,60 +312,29 @@ def result(filename: str):
             risk_score_breakdown=analysis["risk_score_breakdown"],
             executive_summary=analysis["executive_summary"],
             model_comparison=analysis["model_comparison"],
-            pie_labels=pie_labels,
-            pie_values=pie_values,
-            bar_labels=bar_labels,
-            bar_values=bar_values,
-            confidence_hist_labels=analysis["confidence_histogram"]["labels"],
-            confidence_hist_counts=analysis["confidence_histogram"]["counts"],
-            high_conf_threshold=0.85,
+            chart_payload_json=build_chart_payload_json(
+                pie_labels,
+                pie_values,
+                bar_labels,
+                bar_values,
+                analysis["confidence_histogram"]["labels"],
+                analysis["confidence_histogram"]["counts"],
+                HIGH_CONF_THRESHOLD,
+            ),
+            high_conf_threshold=HIGH_CONF_THRESHOLD,
             error=None,
         )
     except Exception as exc:
         return render_template(
             "results.html",
+            **EMPTY_ANALYSIS,
             filename=filename,
             analyzed_at=current_analysis_timestamp(),
-            results=[],
-            summary={
-                "total_clauses": 0,
-                "high_risk_count": 0,
-                "medium_risk_count": 0,
-                "low_risk_count": 0,
-                "neutral_count": 0,
-                "severity_counts": {"High": 0, "Medium": 0, "Low": 0, "None": 0},
-                "severity_percentages": {"High": 0, "Medium": 0, "Low": 0, "None": 0},
-                "label_counts": {},
-                "label_percentages": {},
-            },
-            overall_risk_score=0,
-            risk_score_breakdown={
-                "impact_weights": {
-                    "Liability Risk": 1.6,
-                    "Termination Risk": 1.5,
-                    "Data Privacy Risk": 1.3,
-                    "Payment Risk": 1.1,
-                    "Neutral": 0.0,
-                },
-                "total_severity_score": 0,
-                "max_possible": 1,
-                "normalized_score": 0,
-                "formula": "score = (sum(impact(label) * confidence) / sum(impact(label))) * 100",
-            },
-            executive_summary=[],
-            model_comparison={"available": False, "bert_macro_f1": None, "legal_bert_macro_f1": None, "delta": None},
-            pie_labels=[],
-            pie_values=[],
-            bar_labels=["High", "Medium", "Low", "None"],
-            bar_values=[0, 0, 0, 0],
-            confidence_hist_labels=["0.0-0.1", "0.1-0.2", "0.2-0.3", "0.3-0.4", "0.4-0.5", "0.5-0.6", "0.6-0.7", "0.7-0.8", "0.8-0.9", "0.9-1.0"],
-            confidence_hist_counts=[0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            high_conf_threshold=0.85,
             error=str(exc),
         )
 
 @app.route("/explain", methods=["POST"])
-def explain_clause():
+async def explain_clause():
     payload = request.get_json(silent=True) or {}
     clause = (payload.get("clause") or "").strip()
 
@@ -200,32 +342,56 @@ def explain_clause():
         return jsonify({"error": "Missing clause text."}), 400
 
     try:
-        explanation = explain_clause_with_shap(clause)
+        explanation = await asyncio.to_thread(explain, clause)
         return jsonify(explanation)
     except Exception as exc:
         return jsonify({"error": str(exc)}), 500
 
 
+@app.route("/explain-batch", methods=["POST"])
+async def explain_clause_batch():
+    payload = request.get_json(silent=True) or {}
+    clauses = payload.get("clauses")
+
+    if not isinstance(clauses, list):
+        return jsonify({"error": "Expected a list of clauses."}), 400
+
+    clauses = [str(clause).strip() for clause in clauses if str(clause or "").strip()]
+    if not clauses:
+        return jsonify({"error": "Missing clause text."}), 400
+
+    try:
+        explanations = await asyncio.to_thread(explain_batch, clauses)
+        return jsonify(explanations)
+    except Exception as exc:
+        return jsonify({"error": str(exc)}), 500
+
+
 @app.route("/download-report/<filename>", methods=["GET"])
 def download_report(filename: str):
     """Generate and download a PDF report for the analyzed contract."""
-    filename = secure_filename(filename)
-    file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-    if not os.path.exists(file_path):
+    upload_path = safe_upload_path(filename)
+    if upload_path is None:
         return redirect(url_for("index"))
+    filename = upload_path.name
+    file_path = str(upload_path)
 
     try:
-        analysis = analyze_contract(file_path)
+        analysis = cached_analysis(file_path)
         analyzed_at = current_analysis_timestamp()
-        pdf_data = generate_risk_report_pdf(
+        report_stream = tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_BYTES)
+        generate_risk_report_pdf(
             filename=filename,
             analyzed_at=analyzed_at,
             summary=analysis["summary"],
             overall_risk_score=analysis["overall_risk_score"],
             results=analysis["results"],
+            output=report_stream,
+            high_items=analysis["high_items"],
         )
+        report_stream.seek(0)
         return send_file(
-            BytesIO(pdf_data),
+            report_stream,
             mimetype="application/pdf",
             as_attachment=True,
             download_name=f"risk_report_{filename.rsplit('.', 1)[0]}.pdf",
@@ -248,8 +414,7 @@ def evaluation_dashboard():
         )
 
     try:
-        with open(report_path, "r", encoding="utf-8") as handle:
-            report = json.load(handle)
+        report = load_json_cached(report_path)
     except Exception as exc:
         return render_template(
             "evaluation.html",
@@ -262,8 +427,7 @@ def evaluation_dashboard():
     metrics = {key: value for key, value in report.items() if key in {"bert", "baseline"}}
     comparison_path = os.path.join("evaluation", "baseline_comparison.json")
     if os.path.exists(comparison_path):
-        with open(comparison_path, "r", encoding="utf-8") as handle:
-            comparison = json.load(handle)
+        comparison = load_json_cached(comparison_path)
     else:
         comparison = {}
     artifacts = report.get("artifacts", {})
@@ -294,13 +458,23 @@ def evaluation_dashboard():
 def evaluation_artifact(filename: str):
     """Serve generated evaluation plots from evaluation/ directory."""
     safe_name = secure_filename(filename)
-    return send_from_directory("evaluation", safe_name)
+    return send_from_directory("evaluation", safe_name, conditional=True, max_age=ARTIFACT_MAX_AGE)
 
 
 @app.route("/api/metrics", methods=["GET"])
 def api_metrics():
-    metrics = load_metrics("evaluation/metrics.json")
-    return jsonify(metrics)
+    metrics_path = "evaluation/metrics.json"
+    etag = format(os.stat(metrics_path).st_mtime_ns, "x") if os.path.exists(metrics_path) else None
+    if etag and request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(load_metrics(metrics_path))
+
+    if etag:
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = ARTIFACT_MAX_AGE
+    return response
 
 
 @app.route("/api/error-samples", methods=["GET"])
@@ -309,5 +483,10 @@ def api_error_samples():
     return jsonify(samples)
 
 
+# ASGI entry point for production serving: uvicorn app:asgi_app
+asgi_app = WsgiToAsgi(app)
+
+
 if __name__ == "__main__":
+    # Development fallback only.
     app.run(debug=True)
@@ -3,8 +3,11 @@ scripts/create_sample_pdfs.py
 ------------------------------
 Creates 2 realistic sample contract PDFs in data/sample_contracts/
 for testing the pdf_extractor module.
+
+Each PDF is written alongside a .hash sidecar holding a digest of its
+source rows; re-running the script skips PDFs whose content is unchanged.
 """
-from fpdf import FPDF
+import hashlib
 import os
 
 os.makedirs("data/sample_contracts", exist_ok=True)
@@ -84,6 +87,8 @@ c2_text = [
 ]
 
 def make_pdf(rows, filename):
+    from fpdf import FPDF
+
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
@@ -100,6 +105,20 @@ def make_pdf(rows, filename):
     pdf.output(filename)
     print(f"Created: {filename}")
 
-make_pdf(c1_text, "data/sample_contracts/software_services_agreement.pdf")
-make_pdf(c2_text, "data/sample_contracts/mutual_nda.pdf")
+def make_pdf_if_changed(rows, filename):
+    digest = hashlib.sha1(repr(rows).encode("utf-8")).hexdigest()
+    hash_path = f"{filename}.hash"
+
+    if os.path.exists(filename) and os.path.exists(hash_path):
+        with open(hash_path, "r", encoding="utf-8") as handle:
+            if handle.read().strip() == digest:
+                print(f"Unchanged: {filename}")
+                return
+
+    make_pdf(rows, filename)
+    with open(hash_path, "w", encoding="utf-8") as handle:
+        handle.write(digest)
+
+make_pdf_if_changed(c1_text, "data/sample_contracts/software_services_agreement.pdf")
+make_pdf_if_changed(c2_text, "data/sample_contracts/mutual_nda.pdf")
 print("Done.")
@@ -1,19 +1,23 @@
 import csv
-import json
 import os
 from typing import Dict, List
 
+import orjson
+
 
 def load_metrics(report_path: str = "evaluation/metrics.json") -> Dict[str, object]:
     if not os.path.exists(report_path):
         return {}
-    with open(report_path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with open(report_path, "rb") as handle:
+        return orjson.loads(handle.read())
 
 
 def load_error_samples(csv_path: str = "evaluation/error_samples.csv") -> List[Dict[str, object]]:
     if not os.path.exists(csv_path):
         return []
-    with open(csv_path, "r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        return list(reader)
+    with open(csv_path, "r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return []
+        return [dict(zip(header, row)) for row in reader]
@@ -0,0 +1,23 @@
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson; responses are emitted as bytes."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=_ORJSON_OPTIONS),
+            mimetype="application/json",
+        )
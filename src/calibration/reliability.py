@@ -1,48 +1,98 @@
 from typing import Dict, List
 
-import matplotlib.pyplot as plt
 import numpy as np
 
+_SVG_WIDTH = 480
+_SVG_HEIGHT = 400
+_SVG_MARGIN = {"left": 60, "right": 20, "top": 40, "bottom": 50}
+
+_SVG_TEMPLATE = """<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" font-family="sans-serif">
+<rect width="{width}" height="{height}" fill="#ffffff"/>
+<text x="{title_x}" y="24" font-size="16" text-anchor="middle">Reliability Diagram</text>
+{bars}
+<line x1="{x0}" y1="{y0}" x2="{x1}" y2="{y1}" stroke="#64748b" stroke-width="1.5" stroke-dasharray="6 4"/>
+<rect x="{x0}" y="{y1}" width="{plot_w}" height="{plot_h}" fill="none" stroke="#000000"/>
+{ticks}
+<text x="{title_x}" y="{xlabel_y}" font-size="13" text-anchor="middle">Confidence</text>
+<text x="16" y="{ylabel_y}" font-size="13" text-anchor="middle" transform="rotate(-90 16 {ylabel_y})">Accuracy</text>
+<line x1="{legend_x}" y1="{legend_y}" x2="{legend_x2}" y2="{legend_y}" stroke="#64748b" stroke-width="1.5" stroke-dasharray="6 4"/>
+<text x="{legend_text_x}" y="{legend_text_y}" font-size="11">Perfect Calibration</text>
+</svg>
+"""
+
+
+def _bin_statistics(confidences: np.ndarray, correct: np.ndarray, bins: int):
+	"""Return per-bin counts, accuracy sums, and confidence sums in one pass."""
+	bin_edges = np.linspace(0.0, 1.0, bins + 1)
+	idx = np.clip(np.digitize(confidences, bin_edges) - 1, 0, bins - 1)
+	counts = np.bincount(idx, minlength=bins)
+	acc_sum = np.bincount(idx, weights=correct, minlength=bins)
+	conf_sum = np.bincount(idx, weights=confidences, minlength=bins)
+	return bin_edges, counts, acc_sum, conf_sum
+
 
 def compute_ece(confidences: List[float], correct: List[int], bins: int = 10) -> float:
 	"""Compute Expected Calibration Error (ECE)."""
-	confidences = np.array(confidences)
-	correct = np.array(correct)
-	bin_edges = np.linspace(0.0, 1.0, bins + 1)
-	ece = 0.0
+	confidences = np.asarray(confidences, dtype=float)
+	correct = np.asarray(correct, dtype=float)
+	if confidences.size == 0:
+		return 0.0
 
-	for i in range(bins):
-		mask = (confidences >= bin_edges[i]) & (confidences < bin_edges[i + 1])
-		if not np.any(mask):
-			continue
-		bin_acc = correct[mask].mean()
-		bin_conf = confidences[mask].mean()
-		ece += (mask.mean()) * abs(bin_acc - bin_conf)
+	_, counts, acc_sum, conf_sum = _bin_statistics(confidences, correct, bins)
+	nonzero = counts > 0
+	bin_acc = acc_sum[nonzero] / counts[nonzero]
+	bin_conf = conf_sum[nonzero] / counts[nonzero]
+	ece = np.sum((counts[nonzero] / confidences.size) * np.abs(bin_acc - bin_conf))
 
 	return round(float(ece), 4)
 
 
 def plot_reliability_diagram(confidences: List[float], correct: List[int], out_path: str, bins: int = 10) -> None:
-	"""Plot reliability diagram for calibration diagnostics."""
-	confidences = np.array(confidences)
-	correct = np.array(correct)
-	bin_edges = np.linspace(0.0, 1.0, bins + 1)
+	"""Write a reliability diagram for calibration diagnostics as an SVG file."""
+	confidences = np.asarray(confidences, dtype=float)
+	correct = np.asarray(correct, dtype=float)
+	bin_edges, counts, acc_sum, _ = _bin_statistics(confidences, correct, bins)
 	bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-	accs = []
-
-	for i in range(bins):
-		mask = (confidences >= bin_edges[i]) & (confidences < bin_edges[i + 1])
-		accs.append(correct[mask].mean() if np.any(mask) else 0.0)
-
-	fig, ax = plt.subplots(figsize=(6, 5))
-	ax.plot([0, 1], [0, 1], linestyle="--", color="#64748b", label="Perfect Calibration")
-	ax.bar(bin_centers, accs, width=1 / bins, color="#334155", alpha=0.8)
-	ax.set_xlabel("Confidence")
-	ax.set_ylabel("Accuracy")
-	ax.set_title("Reliability Diagram")
-	ax.set_xlim(0, 1)
-	ax.set_ylim(0, 1)
-	ax.legend()
-	fig.tight_layout()
-	fig.savefig(out_path, dpi=200)
-	plt.close(fig)
+	accs = np.divide(acc_sum, counts, out=np.zeros(bins), where=counts > 0)
+
+	plot_w = _SVG_WIDTH - _SVG_MARGIN["left"] - _SVG_MARGIN["right"]
+	plot_h = _SVG_HEIGHT - _SVG_MARGIN["top"] - _SVG_MARGIN["bottom"]
+	x0 = _SVG_MARGIN["left"]
+	y0 = _SVG_MARGIN["top"] + plot_h
+
+	bar_w = plot_w / bins
+	bars = "\n".join(
+		f'<rect x="{x0 + (center - 0.5 / bins) * plot_w:.2f}" y="{y0 - acc * plot_h:.2f}" '
+		f'width="{bar_w:.2f}" height="{acc * plot_h:.2f}" fill="#334155" fill-opacity="0.8"/>'
+		for center, acc in zip(bin_centers, np.clip(accs, 0.0, 1.0))
+	)
+
+	tick_values = np.linspace(0.0, 1.0, 6)
+	ticks = "\n".join(
+		f'<text x="{x0 + value * plot_w:.2f}" y="{y0 + 18}" font-size="11" text-anchor="middle">{value:.1f}</text>\n'
+		f'<text x="{x0 - 8}" y="{y0 - value * plot_h + 4:.2f}" font-size="11" text-anchor="end">{value:.1f}</text>'
+		for value in tick_values
+	)
+
+	svg = _SVG_TEMPLATE.format(
+		width=_SVG_WIDTH,
+		height=_SVG_HEIGHT,
+		title_x=x0 + plot_w / 2,
+		bars=bars,
+		x0=x0,
+		y0=y0,
+		x1=x0 + plot_w,
+		y1=_SVG_MARGIN["top"],
+		plot_w=plot_w,
+		plot_h=plot_h,
+		ticks=ticks,
+		xlabel_y=_SVG_HEIGHT - 12,
+		ylabel_y=_SVG_MARGIN["top"] + plot_h / 2,
+		legend_x=x0 + 12,
+		legend_x2=x0 + 40,
+		legend_y=_SVG_MARGIN["top"] + 16,
+		legend_text_x=x0 + 46,
+		legend_text_y=_SVG_MARGIN["top"] + 20,
+	)
+	with open(out_path, "w", encoding="utf-8") as handle:
+		handle.write(svg)
@@ -1,8 +1,11 @@
-from typing import Tuple
+import hashlib
+from typing import Dict, Tuple
 
 import torch
 from torch import nn
 
+torch.set_float32_matmul_precision("high")
+
 
 class TemperatureScaler(nn.Module):
 	"""Learn a single temperature for logit scaling."""
@@ -14,8 +17,27 @@ class TemperatureScaler(nn.Module):
 		return logits / self.temperature
 
 
+_FIT_CACHE_SIZE = 8
+_fit_cache: Dict[tuple, Tuple[TemperatureScaler, float]] = {}
+
+
+def _fit_cache_key(logits: torch.Tensor, labels: torch.Tensor, max_iter: int) -> tuple:
+	digest = hashlib.blake2b(digest_size=16)
+	digest.update(logits.detach().cpu().contiguous().numpy().tobytes())
+	digest.update(labels.detach().cpu().contiguous().numpy().tobytes())
+	return tuple(logits.shape), tuple(labels.shape), max_iter, digest.digest()
+
+
 def fit_temperature(logits: torch.Tensor, labels: torch.Tensor, max_iter: int = 50) -> Tuple[TemperatureScaler, float]:
-	"""Optimize temperature on validation logits using NLL."""
+	"""Optimize temperature on validation logits using NLL.
+
+	Results are memoized on the logits/labels content, so repeated evaluation
+	runs over the same validation set reuse the fitted scaler.
+	"""
+	key = _fit_cache_key(logits, labels, max_iter)
+	if key in _fit_cache:
+		return _fit_cache[key]
+
 	scaler = TemperatureScaler()
 	optimizer = torch.optim.LBFGS([scaler.temperature], lr=0.1, max_iter=max_iter)
 	criterion = nn.CrossEntropyLoss()
@@ -28,8 +50,24 @@ def fit_temperature(logits: torch.Tensor, labels: torch.Tensor, max_iter: int =
 
 	optimizer.step(closure)
 	final_loss = float(criterion(scaler(logits), labels).item())
+
+	if len(_fit_cache) >= _FIT_CACHE_SIZE:
+		_fit_cache.pop(next(iter(_fit_cache)))
+	_fit_cache[key] = (scaler, final_loss)
 	return scaler, final_loss
 
 
 def apply_temperature(logits: torch.Tensor, scaler: TemperatureScaler) -> torch.Tensor:
-	return torch.softmax(scaler(logits), dim=-1)
+	with torch.inference_mode():
+		return torch.softmax(scaler(logits), dim=-1)
+
+
+def calibrated_top1(logits: torch.Tensor, scaler: TemperatureScaler) -> Tuple[torch.Tensor, torch.Tensor]:
+	"""Return (confidence, class index) of the top calibrated class per row.
+
+	Uses exp(max - logsumexp) so the full [N, C] probability matrix is never built.
+	"""
+	with torch.inference_mode():
+		scaled = scaler(logits)
+		top_logits, top_idx = scaled.max(dim=-1)
+		return torch.exp(top_logits - torch.logsumexp(scaled, dim=-1)), top_idx
@@ -5,7 +5,13 @@ Maps fine-grained CUAD contract categories to high-level risk categories
 including the new IP Risk category.
 """
 
-from typing import Dict
+import re
+from typing import Dict, Iterable
+
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:  # pragma: no cover - optional fast path
+    ahocorasick = None
 
 
 # Mapping from CUAD dataset categories to risk categories
@@ -66,6 +72,74 @@ CUAD_TO_RISK_CATEGORY = {
 }
 
 
+# Keyword tables for text-based detection (built once, not per call)
+_IP_KEYWORDS = (
+    'intellectual property', 'ip rights', 'patent', 'trademark', 'copyright',
+    'trade secret', 'proprietary', 'source code', 'license grant',
+    'ownership', 'assignment', 'work for hire', 'work made for hire',
+    'derivative works', 'joint ownership', 'irrevocable', 'perpetual',
+    'infringement', 'license', 'licensor', 'licensee'
+)
+
+_PRIVACY_KEYWORDS = (
+    'personal data', 'personally identifiable', 'pii',
+    'gdpr', 'ccpa', 'data protection', 'data privacy',
+    'data breach', 'data subject', 'data processing',
+    'consent', 'opt-in', 'opt-out', 'privacy policy',
+    'sensitive data', 'biometric', 'health information',
+    'financial information', 'data security'
+)
+
+
+# Fallback keywords for unlisted CUAD labels, in priority order
+_FALLBACK_KEYWORDS = (
+    ("ip", "IP Risk", ('ip', 'intellectual property', 'patent', 'trademark',
+                       'copyright', 'license', 'ownership')),
+    ("liab", "Liability Risk", ('liability', 'indemnif', 'warranty', 'insurance')),
+    ("term", "Termination Risk", ('termination', 'expir', 'renewal', 'end')),
+    ("pay", "Payment Risk", ('payment', 'fee', 'price', 'cost', 'revenue', 'damage')),
+    ("priv", "Data Privacy Risk", ('data', 'privacy', 'personal', 'pii', 'gdpr', 'ccpa')),
+)
+
+# Zero-width lookahead so every position is tested and overlapping keywords
+# from different categories are all reported (plain substring semantics).
+_FALLBACK_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{group}>{'|'.join(re.escape(kw) for kw in keywords)})"
+        for group, _, keywords in _FALLBACK_KEYWORDS
+    ) + ")"
+)
+_FALLBACK_CATEGORIES = tuple((group, category) for group, category, _ in _FALLBACK_KEYWORDS)
+
+
+def _build_automaton(keywords: Iterable[str]):
+    """Build a multi-pattern automaton over the keywords, if pyahocorasick is available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw_id, kw in enumerate(keywords):
+        automaton.add_word(kw, kw_id)
+    automaton.make_automaton()
+    return automaton
+
+
+_IP_AUTOMATON = _build_automaton(_IP_KEYWORDS)
+_PRIVACY_AUTOMATON = _build_automaton(_PRIVACY_KEYWORDS)
+
+
+def _has_keyword_hits(text_lower: str, automaton, keywords: tuple, needed: int = 2) -> bool:
+    """Return True once at least `needed` distinct keywords occur in the text."""
+    if automaton is None:
+        return sum(1 for kw in keywords if kw in text_lower) >= needed
+
+    hits = set()
+    for _, kw_id in automaton.iter(text_lower):
+        hits.add(kw_id)
+        if len(hits) >= needed:
+            return True
+    return False
+
+
 def map_cuad_to_risk_category(cuad_label: str) -> str:
     """
     Map a CUAD fine-grained label to a high-level risk category.
@@ -78,32 +152,16 @@ def map_cuad_to_risk_category(cuad_label: str) -> str:
                        "Payment Risk", "IP Risk", or "Neutral"
     """
     # Direct mapping
-    if cuad_label in CUAD_TO_RISK_CATEGORY:
-        return CUAD_TO_RISK_CATEGORY[cuad_label]
-    
-    # Keyword-based fallback for unlisted categories
-    label_lower = cuad_label.lower()
-    
-    # Check for IP-related keywords
-    if any(kw in label_lower for kw in ['ip', 'intellectual property', 'patent', 'trademark', 
-                                          'copyright', 'license', 'ownership']):
-        return "IP Risk"
-    
-    # Check for liability keywords
-    if any(kw in label_lower for kw in ['liability', 'indemnif', 'warranty', 'insurance']):
-        return "Liability Risk"
+    mapped = CUAD_TO_RISK_CATEGORY.get(cuad_label)
+    if mapped is not None:
+        return mapped
     
-    # Check for termination keywords
-    if any(kw in label_lower for kw in ['termination', 'expir', 'renewal', 'end']):
-        return "Termination Risk"
-    
-    # Check for payment keywords
-    if any(kw in label_lower for kw in ['payment', 'fee', 'price', 'cost', 'revenue', 'damage']):
-        return "Payment Risk"
-    
-    # Check for data privacy keywords
-    if any(kw in label_lower for kw in ['data', 'privacy', 'personal', 'pii', 'gdpr', 'ccpa']):
-        return "Data Privacy Risk"
+    # Keyword-based fallback for unlisted categories: one scan finds every
+    # category whose keywords occur, then the highest-priority one wins.
+    found = {match.lastgroup for match in _FALLBACK_RE.finditer(cuad_label.lower())}
+    for group, category in _FALLBACK_CATEGORIES:
+        if group in found:
+            return category
     
     # Default to neutral
     return "Neutral"
@@ -115,21 +173,8 @@ def detect_ip_risk_from_text(text: str) -> bool:
     
     This is useful when the model wasn't explicitly trained on "IP Risk" as a category.
     """
-    text_lower = text.lower()
-    
-    ip_keywords = [
-        'intellectual property', 'ip rights', 'patent', 'trademark', 'copyright',
-        'trade secret', 'proprietary', 'source code', 'license grant',
-        'ownership', 'assignment', 'work for hire', 'work made for hire',
-        'derivative works', 'joint ownership', 'irrevocable', 'perpetual',
-        'infringement', 'license', 'licensor', 'licensee'
-    ]
-    
-    # Count keyword matches
-    matches = sum(1 for kw in ip_keywords if kw in text_lower)
-    
-    # If 2+ IP keywords present, likely IP risk
-    return matches >= 2
+    # If 2+ distinct IP keywords present, likely IP risk
+    return _has_keyword_hits(text.lower(), _IP_AUTOMATON, _IP_KEYWORDS)
 
 
 def detect_data_privacy_risk_from_text(text: str) -> bool:
@@ -138,20 +183,7 @@ def detect_data_privacy_risk_from_text(text: str) -> bool:
     
     Since CUAD doesn't have explicit privacy categories, we detect from text.
     """
-    text_lower = text.lower()
-    
-    privacy_keywords = [
-        'personal data', 'personally identifiable', 'pii',
-        'gdpr', 'ccpa', 'data protection', 'data privacy',
-        'data breach', 'data subject', 'data processing',
-        'consent', 'opt-in', 'opt-out', 'privacy policy',
-        'sensitive data', 'biometric', 'health information',
-        'financial information', 'data security'
-    ]
-    
-    matches = sum(1 for kw in privacy_keywords if kw in text_lower)
-    
-    return matches >= 2
+    return _has_keyword_hits(text.lower(), _PRIVACY_AUTOMATON, _PRIVACY_KEYWORDS)
 
 
 def enhance_label_with_text_detection(
@@ -170,24 +202,32 @@ def enhance_label_with_text_detection(
     Returns:
         (enhanced_label, adjusted_confidence, detection_reason)
     """
+    mapped_label = map_cuad_to_risk_category(original_label)
+    label_lower = original_label.lower()
+
+    # Text detection can only change the outcome for a low-confidence Neutral
+    # prediction (override) or an IP-mapped license/ownership label (boost);
+    # everything else keeps the CUAD mapping without scanning the clause.
+    low_confidence_neutral = original_label == "Neutral" and confidence < 0.70
+    ip_label = mapped_label == "IP Risk" and ("license" in label_lower or "ownership" in label_lower)
+    if not (low_confidence_neutral or ip_label):
+        return mapped_label, confidence, "CUAD category mapping"
+
+    clause_lower = clause_text.lower()
+
     # Check if IP risk detected in text
-    if detect_ip_risk_from_text(clause_text):
+    if _has_keyword_hits(clause_lower, _IP_AUTOMATON, _IP_KEYWORDS):
         # If model wasn't confident, override with IP Risk
-        if original_label == "Neutral" and confidence < 0.70:
+        if low_confidence_neutral:
             return "IP Risk", 0.75, "Text-based IP keyword detection"
-        # If model suggested something else, boost confidence if it's IP-related
-        elif "license" in original_label.lower() or "ownership" in original_label.lower():
-            mapped = map_cuad_to_risk_category(original_label)
-            if mapped == "IP Risk":
-                return mapped, min(confidence + 0.10, 1.0), "CUAD label mapped to IP Risk"
-    
+        # If model suggested an IP-related label, boost confidence
+        return mapped_label, min(confidence + 0.10, 1.0), "CUAD label mapped to IP Risk"
+
     # Check if data privacy risk detected in text
-    if detect_data_privacy_risk_from_text(clause_text):
-        if original_label == "Neutral" and confidence < 0.70:
-            return "Data Privacy Risk", 0.75, "Text-based privacy keyword detection"
-    
+    if low_confidence_neutral and _has_keyword_hits(clause_lower, _PRIVACY_AUTOMATON, _PRIVACY_KEYWORDS):
+        return "Data Privacy Risk", 0.75, "Text-based privacy keyword detection"
+
     # No enhancement needed, use CUAD mapping
-    mapped_label = map_cuad_to_risk_category(original_label)
     return mapped_label, confidence, "CUAD category mapping"
 
 
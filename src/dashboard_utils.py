@@ -4,13 +4,23 @@ import io
 import importlib
 import json
 import os
+import sys
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Union
+from xml.sax.saxutils import escape
 
 import numpy as np
 
 from src.scoring.risk_score import attach_risk_scores
 
+# Canonical severity levels in display order. Interned so comparisons and
+# Counter keys against them hit the identity fast path.
+SEVERITIES = tuple(map(sys.intern, ("High", "Medium", "Low", "None")))
+
 
 def truncate_clause(text: str, limit: int = 120) -> str:
     """Return a short preview for collapsed clause cards."""
@@ -20,6 +30,39 @@ def truncate_clause(text: str, limit: int = 120) -> str:
     return f"{cleaned[:limit].rstrip()}..."
 
 
+@dataclass(frozen=True)
+class ResultsView:
+    """Column-wise view of clause results, so dashboard helpers avoid per-dict lookups."""
+
+    labels: List[str]
+    severities: List[str]
+    confidences: np.ndarray
+    clauses: List[str]
+
+    @classmethod
+    def from_dicts(cls, results: List[Dict[str, object]]) -> "ResultsView":
+        """Extract every column in a single pass over the result dicts."""
+        labels: List[str] = []
+        severities: List[str] = []
+        clauses: List[str] = []
+        confidences = np.empty(len(results), dtype=np.float64)
+        for idx, item in enumerate(results):
+            # Intern at the boundary: results loaded from the JSON cache carry a
+            # fresh string object per clause for the same few label values.
+            labels.append(sys.intern(str(item.get("label", "Neutral"))))
+            severities.append(sys.intern(str(item.get("severity", "None"))))
+            clauses.append(str(item.get("clause", "")))
+            confidences[idx] = float(item.get("confidence", 0.0))
+        return cls(labels, severities, confidences, clauses)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+
+def _as_view(results: Union[List[Dict[str, object]], ResultsView]) -> ResultsView:
+    return results if isinstance(results, ResultsView) else ResultsView.from_dicts(results)
+
+
 def calculate_overall_risk_score(results: List[Dict[str, object]]) -> float:
     """Compute normalized risk score using impact x likelihood."""
     if not results:
@@ -35,23 +78,25 @@ def build_risk_score_breakdown(results: List[Dict[str, object]]) -> Dict[str, ob
     return breakdown
 
 
-def build_risk_summary(results: List[Dict[str, object]]) -> Dict[str, object]:
-    """Create dashboard counts, percentages, and chart-ready distributions."""
-    total = len(results)
+def build_risk_summary(
+    results: Union[List[Dict[str, object]], ResultsView],
+    severity_counter: Optional[Dict[str, int]] = None,
+) -> Dict[str, object]:
+    """
+    Create dashboard counts, percentages, and chart-ready distributions.
 
-    severity_counts = {
-        "High": 0,
-        "Medium": 0,
-        "Low": 0,
-        "None": 0,
-    }
+    Pass ``severity_counter`` (the counts from ``enrich_results``) to skip recounting severities.
+    """
+    view = _as_view(results)
+    total = len(view)
 
-    label_counts: Dict[str, int] = {}
-    for item in results:
-        severity = str(item.get("severity", "None"))
-        label = str(item.get("label", "Neutral"))
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        label_counts[label] = label_counts.get(label, 0) + 1
+    if severity_counter is None:
+        severity_counter = Counter(view.severities)
+    label_counter = Counter(view.labels)
+
+    severity_counts = dict.fromkeys(SEVERITIES, 0)
+    severity_counts.update(severity_counter)
+    label_counts: Dict[str, int] = dict(label_counter)
 
     def pct(value: int) -> float:
         return round((value / total) * 100, 1) if total else 0.0
@@ -74,15 +119,18 @@ def build_risk_summary(results: List[Dict[str, object]]) -> Dict[str, object]:
     return summary
 
 
-def build_confidence_histogram_data(results: List[Dict[str, object]], bins: int = 10) -> Dict[str, List[float]]:
+def build_confidence_histogram_data(
+    results: Union[List[Dict[str, object]], ResultsView],
+    bins: int = 10,
+) -> Dict[str, List[float]]:
     """Create histogram bin labels/counts for prediction confidence calibration view."""
-    confidences = [float(item.get("confidence", 0.0)) for item in results]
-    if not confidences:
+    if not len(results):
         return {
             "labels": [f"{round(i / bins, 1)}-{round((i + 1) / bins, 1)}" for i in range(bins)],
             "counts": [0 for _ in range(bins)],
         }
 
+    confidences = _as_view(results).confidences
     hist, edges = np.histogram(confidences, bins=bins, range=(0.0, 1.0))
     labels = [f"{edges[i]:.1f}-{edges[i + 1]:.1f}" for i in range(len(edges) - 1)]
 
@@ -92,7 +140,12 @@ def build_confidence_histogram_data(results: List[Dict[str, object]], bins: int
     }
 
 
-def build_executive_summary(results: List[Dict[str, object]], summary: Dict[str, object], overall_risk_score: float) -> List[str]:
+def build_executive_summary(
+    results: List[Dict[str, object]],
+    summary: Dict[str, object],
+    overall_risk_score: float,
+    high_items: Optional[List[Dict[str, object]]] = None,
+) -> List[str]:
     """Generate a concise executive summary in 5–7 sentences."""
     total = int(summary.get("total_clauses", 0))
     high_count = int(summary.get("high_risk_count", 0))
@@ -111,8 +164,9 @@ def build_executive_summary(results: List[Dict[str, object]], summary: Dict[str,
     termination_count = int(label_counts.get("Termination Risk", 0))
     termination_pct = round((termination_count / total) * 100, 1) if total else 0
 
-    high_examples = [item for item in results if str(item.get("severity", "")) == "High"]
-    high_example_text = high_examples[0]["clause"] if high_examples else "No high-severity clauses were identified."
+    if high_items is None:
+        high_items = _high_severity_items(results)
+    high_example_text = high_items[0]["clause"] if high_items else "No high-severity clauses were identified."
     high_example_text = truncate_clause(high_example_text, 180)
 
     summary_lines = [
@@ -132,6 +186,22 @@ def build_executive_summary(results: List[Dict[str, object]], summary: Dict[str,
     return summary_lines
 
 
+_json_file_cache: Dict[str, tuple] = {}
+
+
+def load_json_cached(path: str) -> object:
+    """Load a JSON file, re-parsing only when its modification time changes."""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    _json_file_cache[path] = (mtime, payload)
+    return payload
+
+
 def load_model_comparison_metrics(report_path: str = "evaluation/evaluation_report.json") -> Dict[str, object]:
     """Load BERT vs Legal-BERT comparison metrics for dashboard display."""
     if not report_path or not isinstance(report_path, str):
@@ -150,8 +220,7 @@ def load_model_comparison_metrics(report_path: str = "evaluation/evaluation_repo
             "delta": None,
         }
 
-    with open(report_path, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = load_json_cached(report_path)
 
     comparison = payload.get("comparison", {})
     bert_macro_f1 = comparison.get("bert_macro_f1")
@@ -166,7 +235,20 @@ def load_model_comparison_metrics(report_path: str = "evaluation/evaluation_repo
     }
 
 
-def enrich_results(results: List[Dict[str, object]]) -> List[Dict[str, object]]:
+def _high_severity_items(results: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    return [item for item in results if str(item.get("severity", "")) == "High"]
+
+
+class EnrichedResults(NamedTuple):
+    """Enriched clause results plus the partitions downstream helpers reuse."""
+
+    results: List[Dict[str, object]]
+    high_items: List[Dict[str, object]]
+    severity_counts: Counter
+    view: ResultsView
+
+
+def enrich_results(results: List[Dict[str, object]]) -> EnrichedResults:
     """Attach presentation metadata to each clause result."""
     risk_badge_map = {
         "Liability Risk": "badge-risk-liability",
@@ -183,26 +265,30 @@ def enrich_results(results: List[Dict[str, object]]) -> List[Dict[str, object]]:
         "None": "badge-sev-none",
     }
 
+    source = ResultsView.from_dicts(results)
     enriched: List[Dict[str, object]] = []
-    for idx, item in enumerate(results, start=1):
-        clause = str(item.get("clause", "")).strip()
-        label = str(item.get("label", "Neutral"))
-        severity = str(item.get("severity", "None"))
-        confidence = float(item.get("confidence", 0.0))
-
-        enriched.append(
-            {
-                **item,
-                "id": idx,
-                "clause": clause,
-                "clause_preview": truncate_clause(clause, 120),
-                "confidence_pct": round(confidence * 100, 2),
-                "risk_badge_class": risk_badge_map.get(label, "badge-risk-neutral"),
-                "severity_badge_class": severity_badge_map.get(severity, "badge-sev-none"),
-            }
-        )
-
-    return enriched
+    high_items: List[Dict[str, object]] = []
+    clauses: List[str] = []
+    columns = zip(results, source.clauses, source.labels, source.severities, source.confidences.tolist())
+    for idx, (item, clause, label, severity, confidence) in enumerate(columns, start=1):
+        clause = clause.strip()
+        clauses.append(clause)
+
+        enriched_item = {
+            **item,
+            "id": idx,
+            "clause": clause,
+            "clause_preview": truncate_clause(clause, 120),
+            "confidence_pct": round(confidence * 100, 2),
+            "risk_badge_class": risk_badge_map.get(label, "badge-risk-neutral"),
+            "severity_badge_class": severity_badge_map.get(severity, "badge-sev-none"),
+        }
+        enriched.append(enriched_item)
+        if severity == "High":
+            high_items.append(enriched_item)
+
+    view = ResultsView(source.labels, source.severities, source.confidences, clauses)
+    return EnrichedResults(enriched, high_items, Counter(view.severities), view)
 
 
 def current_analysis_timestamp() -> str:
@@ -210,30 +296,66 @@ def current_analysis_timestamp() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
-def generate_risk_report_pdf(
-    filename: str,
-    analyzed_at: str,
-    summary: Dict[str, object],
-    overall_risk_score: float,
-    results: List[Dict[str, object]],
-) -> bytes:
-    """Build a downloadable PDF risk report using reportlab."""
+@lru_cache(maxsize=1)
+def _get_reportlab() -> SimpleNamespace:
+    """Import reportlab and build the shared report styles once per process."""
     colors = importlib.import_module("reportlab.lib.colors")
     pagesizes = importlib.import_module("reportlab.lib.pagesizes")
     styles_module = importlib.import_module("reportlab.lib.styles")
     platypus = importlib.import_module("reportlab.platypus")
 
-    A4 = pagesizes.A4
-    getSampleStyleSheet = styles_module.getSampleStyleSheet
-    Paragraph = platypus.Paragraph
-    SimpleDocTemplate = platypus.SimpleDocTemplate
-    Spacer = platypus.Spacer
-    Table = platypus.Table
-    TableStyle = platypus.TableStyle
+    styles = styles_module.getSampleStyleSheet()
+
+    return SimpleNamespace(
+        A4=pagesizes.A4,
+        styles=styles,
+        # One paragraph per high-severity clause; spaceAfter replaces a separate Spacer.
+        CLAUSE_STYLE=styles_module.ParagraphStyle("ReportClause", parent=styles["Normal"], spaceAfter=10),
+        Paragraph=platypus.Paragraph,
+        SimpleDocTemplate=platypus.SimpleDocTemplate,
+        Spacer=platypus.Spacer,
+        Table=platypus.Table,
+        SUMMARY_TABLE_STYLE=platypus.TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ]
+        ),
+    )
+
 
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=30, leftMargin=30, topMargin=30, bottomMargin=30)
-    styles = getSampleStyleSheet()
+def generate_risk_report_pdf(
+    filename: str,
+    analyzed_at: str,
+    summary: Dict[str, object],
+    overall_risk_score: float,
+    results: List[Dict[str, object]],
+    output: Optional[BinaryIO] = None,
+    high_items: Optional[List[Dict[str, object]]] = None,
+) -> Optional[bytes]:
+    """
+    Build a downloadable PDF risk report using reportlab.
+
+    When ``output`` is given the PDF is written straight into that stream and
+    None is returned; otherwise the PDF bytes are returned.
+    """
+    rl = _get_reportlab()
+    styles = rl.styles
+    Paragraph = rl.Paragraph
+    Spacer = rl.Spacer
+
+    buffer = output if output is not None else io.BytesIO()
+    doc = rl.SimpleDocTemplate(
+        buffer,
+        pagesize=rl.A4,
+        rightMargin=30,
+        leftMargin=30,
+        topMargin=30,
+        bottomMargin=30,
+        pageCompression=1,
+    )
 
     elements = []
     elements.append(Paragraph("Contract Risk Analysis Report", styles["Title"]))
@@ -252,37 +374,35 @@ def generate_risk_report_pdf(
         ["Neutral", str(summary.get("neutral_count", 0))],
     ]
 
-    summary_table = Table(summary_data, colWidths=[200, 120])
-    summary_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ]
-        )
-    )
+    summary_table = rl.Table(summary_data, colWidths=[200, 120])
+    summary_table.setStyle(rl.SUMMARY_TABLE_STYLE)
     elements.append(summary_table)
     elements.append(Spacer(1, 14))
 
     elements.append(Paragraph("High Severity Clauses", styles["Heading2"]))
 
-    high_items = [item for item in results if str(item.get("severity", "")) == "High"]
+    if high_items is None:
+        high_items = _high_severity_items(results)
     if not high_items:
         elements.append(Paragraph("No high severity clauses found.", styles["Normal"]))
     else:
+        clause_style = rl.CLAUSE_STYLE
         for item in high_items:
-            clause = str(item.get("clause", "")).replace("\n", " ")
-            label = str(item.get("label", ""))
+            clause = escape(str(item.get("clause", "")).replace("\n", " "))
+            label = escape(str(item.get("label", "")))
             confidence_pct = round(float(item.get("confidence", 0.0)) * 100, 2)
 
-            elements.append(Paragraph(f"Risk Type: {label}", styles["Heading4"]))
-            elements.append(Paragraph(f"Confidence: {confidence_pct}%", styles["Normal"]))
-            elements.append(Paragraph(f"Clause: {clause}", styles["Normal"]))
-            elements.append(Spacer(1, 10))
+            elements.append(
+                Paragraph(
+                    f"<b>Risk Type: {label}</b><br/>Confidence: {confidence_pct}%<br/>Clause: {clause}",
+                    clause_style,
+                )
+            )
 
     doc.build(elements)
+    if output is not None:
+        return None
+
     pdf_bytes = buffer.getvalue()
     buffer.close()
     return pdf_bytes
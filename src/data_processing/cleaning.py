@@ -1,50 +1,50 @@
 import hashlib
-import logging
 import re
-from typing import List, Tuple
+from functools import lru_cache
 
-logger = logging.getLogger(__name__)
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional fast path
+    xxhash = None
 
 _OCR_NOISE_PATTERN = re.compile(r"\b(?:l\s*\/\s*I|I\s*\/\s*l|\|{2,}|_{2,})\b")
 _MULTI_DOT_PATTERN = re.compile(r"\.{3,}")
+_SPACE_RUN_PATTERN = re.compile(r"[ \t]+")
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
 
 
-def normalize_text(text: str) -> str:
-    """Normalize text for modeling and deduplication."""
-    if not text:
-        return ""
+# Boilerplate clauses repeat across contracts; cache results for clause-sized
+# inputs only so whole documents do not pin memory in the cache.
+_NORMALIZE_CACHE_SIZE = 8192
+_NORMALIZE_CACHE_MAX_CHARS = 4096
+
+
+def _normalize_impl(text: str) -> str:
     cleaned = text.replace("\r\n", "\n").replace("\r", "\n")
     cleaned = cleaned.replace("\x0c", " ")
     cleaned = _OCR_NOISE_PATTERN.sub(" ", cleaned)
     cleaned = _MULTI_DOT_PATTERN.sub(".", cleaned)
-    cleaned = re.sub(r"[ \t]+", " ", cleaned)
-    cleaned = "\n".join(line.strip() for line in cleaned.splitlines())
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    cleaned = _SPACE_RUN_PATTERN.sub(" ", cleaned)
+    cleaned = "\n".join(map(str.strip, cleaned.splitlines()))
+    cleaned = _BLANK_LINES_PATTERN.sub("\n\n", cleaned)
     return cleaned.strip().lower()
 
 
-def _hash_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+_normalize_cached = lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)(_normalize_impl)
 
 
-def deduplicate_clauses(clauses: List[str]) -> Tuple[List[str], int]:
-    """Remove duplicate clauses using hashing. Returns (unique, removed_count)."""
-    seen = set()
-    unique = []
-    removed = 0
-
-    for clause in clauses:
-        normalized = normalize_text(clause)
-        if not normalized:
-            continue
-        hashed = _hash_text(normalized)
-        if hashed in seen:
-            removed += 1
-            continue
-        seen.add(hashed)
-        unique.append(clause)
+def normalize_text(text: str) -> str:
+    """Normalize text for modeling and deduplication."""
+    if not text:
+        return ""
+    if len(text) < _NORMALIZE_CACHE_MAX_CHARS:
+        return _normalize_cached(text)
+    return _normalize_impl(text)
 
-    if removed:
-        logger.info("Removed %s duplicate clauses during cleaning", removed)
 
-    return unique, removed
+def hash_text(text: str) -> bytes:
+    """Return a 16-byte fingerprint of ``text`` for duplicate detection."""
+    data = text.encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
@@ -1,7 +1,18 @@
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import StratifiedShuffleSplit
+
+
+def stratified_split_indices(
+    labels: Sequence[str],
+    test_size: float = 0.2,
+    seed: int = 42,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (train_idx, val_idx) for a stratified split computed from the labels alone."""
+    splitter = StratifiedShuffleSplit(n_splits=1, test_size=test_size, random_state=seed)
+    return next(splitter.split(np.zeros(len(labels)), labels))
 
 
 def load_and_split_data(
@@ -10,12 +21,8 @@ def load_and_split_data(
     seed: int = 42,
 ) -> Tuple[List[str], List[str], List[str], List[str]]:
     """Load CUAD data and return train/validation splits."""
-    df = pd.read_csv(data_path).dropna(subset=["clause_text", "risk_label"])
-    x_train, x_val, y_train, y_val = train_test_split(
-        df["clause_text"].tolist(),
-        df["risk_label"].tolist(),
-        test_size=test_size,
-        random_state=seed,
-        stratify=df["risk_label"],
-    )
-    return x_train, x_val, y_train, y_val
+    df = pd.read_csv(data_path, usecols=["clause_text", "risk_label"]).dropna(subset=["clause_text", "risk_label"])
+    texts = df["clause_text"].to_numpy(dtype=object)
+    labels = df["risk_label"].to_numpy(dtype=object)
+    train_idx, val_idx = stratified_split_indices(labels, test_size=test_size, seed=seed)
+    return texts[train_idx].tolist(), texts[val_idx].tolist(), labels[train_idx].tolist(), labels[val_idx].tolist()
@@ -6,20 +6,19 @@ import logging
 import os
 from datetime import datetime
 from typing import Dict, List, Tuple
-import hashlib
 
 import numpy as np
 import pandas as pd
 import torch
-from sklearn.model_selection import train_test_split
 
 from src.calibration.reliability import compute_ece, plot_reliability_diagram
-from src.calibration.temperature_scaling import apply_temperature, fit_temperature
-from src.data_processing.cleaning import normalize_text
+from src.calibration.temperature_scaling import calibrated_top1, fit_temperature
+from src.data_processing.cleaning import hash_text, normalize_text
+from src.data_processing.split import stratified_split_indices
 from src.evaluation.error_analysis import collect_error_samples, save_error_samples_csv
 from src.evaluation.metrics import compute_metrics, plot_class_distribution, plot_confusion_matrix
 from src.modeling.baseline import baseline_predict, baseline_predict_proba, train_baseline
-from src.modeling.bert_model import predict_logits, predict_with_transformer
+from src.modeling.bert_model import predict_logits
 
 
 logger = logging.getLogger(__name__)
@@ -27,27 +26,21 @@ logger = logging.getLogger(__name__)
 
 def load_and_clean_dataset(data_path: str) -> Tuple[List[str], List[str], List[str], int]:
     """Load dataset, normalize text, and remove duplicates using hashing."""
-    df = pd.read_csv(data_path).dropna(subset=["clause_text", "risk_label"])
-    seen_hashes = set()
-    cleaned_texts: List[str] = []
-    raw_texts: List[str] = []
-    labels: List[str] = []
-    removed_duplicates = 0
-
-    for clause_text, label in zip(df["clause_text"], df["risk_label"]):
-        normalized = normalize_text(str(clause_text))
-        if not normalized:
-            continue
-        hashed = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
-        if hashed in seen_hashes:
-            removed_duplicates += 1
-            continue
-        seen_hashes.add(hashed)
-        cleaned_texts.append(normalized)
-        raw_texts.append(str(clause_text))
-        labels.append(str(label))
-
-    return cleaned_texts, raw_texts, labels, removed_duplicates
+    df = pd.read_csv(data_path, usecols=["clause_text", "risk_label"]).dropna(subset=["clause_text", "risk_label"])
+    raw = df["clause_text"].astype(str)
+    frame = pd.DataFrame(
+        {
+            "raw": raw,
+            "normalized": raw.map(normalize_text),
+            "label": df["risk_label"].astype(str),
+        }
+    )
+    frame = frame[frame["normalized"] != ""]
+    frame["hash"] = frame["normalized"].map(hash_text)
+    unique = frame.drop_duplicates(subset="hash", keep="first")
+    removed_duplicates = len(frame) - len(unique)
+
+    return unique["normalized"].tolist(), unique["raw"].tolist(), unique["label"].tolist(), removed_duplicates
 
 
 def split_dataset(
@@ -58,14 +51,12 @@ def split_dataset(
     seed: int = 42,
 ) -> Tuple[List[str], List[str], List[str], List[str], List[str]]:
     """Split dataset while preserving raw and cleaned text alignment."""
-    x_train, x_val, y_train, y_val, raw_train, raw_val = train_test_split(
-        texts,
-        labels,
-        raw_texts,
-        test_size=test_size,
-        random_state=seed,
-        stratify=labels,
-    )
+    train_idx, val_idx = stratified_split_indices(labels, test_size=test_size, seed=seed)
+    texts_arr = np.asarray(texts, dtype=object)
+    labels_arr = np.asarray(labels, dtype=object)
+    x_train, x_val = texts_arr[train_idx].tolist(), texts_arr[val_idx].tolist()
+    y_train, y_val = labels_arr[train_idx].tolist(), labels_arr[val_idx].tolist()
+    raw_val = np.asarray(raw_texts, dtype=object)[val_idx].tolist()
     return x_train, x_val, y_train, y_val, raw_val
 
 
@@ -83,7 +74,9 @@ def main() -> None:
     baseline_preds, baseline_conf = baseline_predict(baseline_model, baseline_vectorizer, x_val)
     baseline_probs = baseline_predict_proba(baseline_model, baseline_vectorizer, x_val)
 
-    bert_preds, bert_conf, bert_probs = predict_with_transformer("models/bert_model", x_val)
+    # One forward pass over the validation set feeds both the raw and the calibrated metrics.
+    bert_preds, label_ids, logits, label2id = predict_logits("models/bert_model", x_val, y_val)
+    bert_conf = torch.softmax(logits, dim=-1).max(dim=-1).values.tolist()
 
     baseline_metrics = compute_metrics(y_val, baseline_preds, unique_labels)
     bert_metrics = compute_metrics(y_val, bert_preds, unique_labels)
@@ -97,7 +90,6 @@ def main() -> None:
     correct_flags = [1 if true == pred else 0 for true, pred in zip(y_val, bert_preds)]
     ece_before = compute_ece(bert_conf, correct_flags)
 
-    _, label_ids, logits, label2id = predict_logits("models/bert_model", x_val, y_val)
     label_tensor = torch.tensor(label_ids)
     valid_mask = label_tensor >= 0
     if valid_mask.sum().item() == 0:
@@ -106,15 +98,15 @@ def main() -> None:
     logits = logits[valid_mask]
     label_tensor = label_tensor[valid_mask]
     scaler, _ = fit_temperature(logits, label_tensor)
-    calibrated_probs = apply_temperature(logits, scaler).numpy()
-    calibrated_conf = calibrated_probs.max(axis=1).tolist()
+    calibrated_conf_tensor, calibrated_idx = calibrated_top1(logits, scaler)
+    calibrated_conf = calibrated_conf_tensor.tolist()
     id2label = {v: k for k, v in label2id.items()}
-    calibrated_preds = [id2label.get(int(idx), bert_preds[i]) for i, idx in enumerate(calibrated_probs.argmax(axis=1))]
+    calibrated_preds = [id2label.get(idx, bert_preds[i]) for i, idx in enumerate(calibrated_idx.tolist())]
     filtered_y_val = [label for label, valid in zip(y_val, valid_mask.tolist()) if valid]
     calibrated_correct = [1 if true == pred else 0 for true, pred in zip(filtered_y_val, calibrated_preds)]
     ece_after = compute_ece(calibrated_conf, calibrated_correct)
 
-    plot_reliability_diagram(bert_conf, correct_flags, "evaluation/reliability_diagram.png")
+    plot_reliability_diagram(bert_conf, correct_flags, "evaluation/reliability_diagram.svg")
 
     metrics_payload = {
         "generated_at": datetime.utcnow().isoformat() + "Z",
@@ -123,7 +115,7 @@ def main() -> None:
         "artifacts": {
             "confusion_matrix": "evaluation/confusion_matrix.png",
             "class_distribution": "evaluation/class_distribution.png",
-            "reliability_diagram": "evaluation/reliability_diagram.png",
+            "reliability_diagram": "evaluation/reliability_diagram.svg",
         },
     }
 
@@ -1,6 +1,18 @@
 from typing import Dict, List
 
-import csv
+import numpy as np
+import pandas as pd
+
+
+def _lowest_indices(values: np.ndarray, count: int) -> np.ndarray:
+	"""Indices of the ``count`` smallest values, ordered like a stable ascending sort."""
+	if count <= 0 or count >= len(values):
+		return np.argsort(values, kind="stable")[:count]
+	kth = np.partition(values, count - 1)[count - 1]
+	below = np.flatnonzero(values < kth)
+	ties = np.flatnonzero(values == kth)[: count - len(below)]
+	candidates = np.concatenate([below, ties])
+	return candidates[np.argsort(values[candidates], kind="stable")]
 
 
 def collect_error_samples(
@@ -13,20 +25,23 @@ def collect_error_samples(
 	boundary_high: float = 0.55,
 ) -> Dict[str, List[Dict[str, object]]]:
 	"""Collect misclassifications, low-confidence predictions, and boundary cases."""
-	samples = []
-	for text, true_label, pred_label, conf in zip(texts, y_true, y_pred, confidences):
-		samples.append(
-			{
-				"clause_text": text,
-				"true_label": true_label,
-				"pred_label": pred_label,
-				"confidence": round(float(conf), 4),
-			}
-		)
-
-	misclassified = [s for s in samples if s["true_label"] != s["pred_label"]]
-	lowest_conf = sorted(samples, key=lambda s: s["confidence"])[:low_confidence_count]
-	boundary = [s for s in samples if boundary_low <= s["confidence"] <= boundary_high]
+	rounded = np.asarray([round(float(conf), 4) for conf in confidences], dtype=np.float64)
+	count = min(len(texts), len(y_true), len(y_pred), len(rounded))
+	rounded = rounded[:count]
+
+	def sample(index: int) -> Dict[str, object]:
+		return {
+			"clause_text": texts[index],
+			"true_label": y_true[index],
+			"pred_label": y_pred[index],
+			"confidence": float(rounded[index]),
+		}
+
+	mismatch = np.asarray(y_true[:count], dtype=object) != np.asarray(y_pred[:count], dtype=object)
+	misclassified = [sample(index) for index in np.flatnonzero(mismatch)]
+	lowest_conf = [sample(index) for index in _lowest_indices(rounded, low_confidence_count)]
+	boundary_mask = (rounded >= boundary_low) & (rounded <= boundary_high)
+	boundary = [sample(index) for index in np.flatnonzero(boundary_mask)]
 
 	return {
 		"misclassified": misclassified,
@@ -43,7 +58,10 @@ def save_error_samples_csv(samples: Dict[str, List[Dict[str, object]]], out_path
 			rows.append({"category": key, **item})
 
 	fieldnames = ["category", "clause_text", "true_label", "pred_label", "confidence"]
-	with open(out_path, "w", newline="", encoding="utf-8") as handle:
-		writer = csv.DictWriter(handle, fieldnames=fieldnames)
-		writer.writeheader()
-		writer.writerows(rows)
+	# lineterminator matches csv.DictWriter's default so the file format is unchanged.
+	pd.DataFrame.from_records(rows, columns=fieldnames).to_csv(
+		out_path,
+		index=False,
+		encoding="utf-8",
+		lineterminator="\r\n",
+	)
@@ -1,11 +1,21 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List
 
 import numpy as np
 import shap
+import torch
 from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
-from transformers import pipeline
+
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:  # pragma: no cover - optional fast path
+    ahocorasick = None
 
 from src.category_mapper import get_category_description
+from src.inference import MAX_BATCH_SIZE, load_bert_model
 from src.scoring.advanced_risk_scoring import (
     extract_monetary_value,
     extract_duration,
@@ -14,75 +24,103 @@ from src.scoring.advanced_risk_scoring import (
 )
 
 
-def _normalize_prediction_scores(raw_output) -> List[Dict[str, float]]:
-    """Normalize pipeline outputs into a list of {label, score} dicts."""
-    if isinstance(raw_output, dict):
-        return [raw_output]
+SHAP_MAX_LENGTH = 256
 
-    if not isinstance(raw_output, list) or not raw_output:
-        return []
+_EXPLANATION_CACHE_SIZE = 512
+_explanation_cache: "OrderedDict[tuple, Dict[str, object]]" = OrderedDict()
+_explanation_cache_lock = threading.Lock()
 
-    # Case 1: [ {label, score}, ... ]
-    if isinstance(raw_output[0], dict):
-        return raw_output
 
-    # Case 2: [ [ {label, score}, ... ] ]
-    if isinstance(raw_output[0], list) and raw_output[0] and isinstance(raw_output[0][0], dict):
-        return raw_output[0]
+def clause_hash(clause: str) -> str:
+    """Stable key for a clause, shared with clients for explanation caching."""
+    return hashlib.sha1((clause or "").strip().encode("utf-8")).hexdigest()
 
-    return []
 
+def _empty_explanation() -> Dict[str, object]:
+    return {
+        "label": "",
+        "top_contributing_words": [],
+    }
 
-def explain_clause_with_shap(
-    clause: str,
-    model_dir: str = "models/bert_model",
-    top_k: int = 5,
-    shap_threshold: float = 0.01,
-) -> Dict[str, object]:
+
+@lru_cache(maxsize=2)
+def _load_explainer(model_dir: str):
     """
-    Explain BERT prediction for a single clause using SHAP.
+    Build the SHAP explainer once per model directory.
+
+    SHAP scores its masked perturbations through ``score``, which runs the
+    cached BERT model on a whole batch of texts per call.
 
     Returns:
-    {
-      "label": "Liability Risk",
-      "top_contributing_words": ["liability", "indemnify", ...]
-    }
+        explainer, score, class_names
     """
-    clause_text = (clause or "").strip()
-    if not clause_text:
-        return {
-            "label": "",
-            "top_contributing_words": [],
-        }
+    tokenizer, model, device, id2label = load_bert_model(model_dir=model_dir)
+    class_names = list(id2label)
 
-    clf = pipeline(
-        "text-classification",
-        model=model_dir,
-        tokenizer=model_dir,
-        top_k=None,
-    )
+    def score(texts) -> np.ndarray:
+        encoded = tokenizer(
+            [str(text) for text in texts],
+            return_tensors="pt",
+            truncation=True,
+            max_length=SHAP_MAX_LENGTH,
+            padding=True,
+        )
+        encoded = {key: value.to(device) for key, value in encoded.items()}
+        with torch.inference_mode():
+            logits = model(**encoded).logits
+        return torch.softmax(logits, dim=-1).cpu().numpy()
+
+    explainer = shap.Explainer(score, masker=shap.maskers.Text(tokenizer), output_names=class_names)
+    return explainer, score, class_names
 
-    prediction_scores = _normalize_prediction_scores(clf(clause_text))
-    if not prediction_scores:
-        return {
-            "label": "",
-            "top_contributing_words": [],
-        }
 
+def _cache_get(key: tuple):
+    with _explanation_cache_lock:
+        value = _explanation_cache.get(key)
+        if value is not None:
+            _explanation_cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key: tuple, value: Dict[str, object]) -> None:
+    with _explanation_cache_lock:
+        _explanation_cache[key] = value
+        _explanation_cache.move_to_end(key)
+        while len(_explanation_cache) > _EXPLANATION_CACHE_SIZE:
+            _explanation_cache.popitem(last=False)
+
+
+_TOKEN_EDGE_PUNCTUATION = ".,;:!?()[]{}\"'`-_/\\"
+
+
+@lru_cache(maxsize=4096)
+def _normalize_token(token: str) -> str:
+    """Clean a SHAP token for display; stop words normalize to "" so they are skipped."""
+    cleaned = token.replace("##", "").strip().lower().strip(_TOKEN_EDGE_PUNCTUATION)
+    if cleaned in ENGLISH_STOP_WORDS:
+        return ""
+    return cleaned
+
+
+def _explain_from_shap_row(
+    clause_text: str,
+    prediction_scores: List[Dict[str, float]],
+    class_names: List[str],
+    raw_values,
+    token_data,
+    top_k: int,
+    shap_threshold: float,
+) -> Dict[str, object]:
+    """Turn one row of SHAP output into the explanation payload."""
     best = max(prediction_scores, key=lambda item: item["score"])
     predicted_label = best["label"]
 
-    explainer = shap.Explainer(clf)
-    shap_values = explainer([clause_text])
-
-    output_names = getattr(shap_values, "output_names", [])
-    class_names = list(output_names) if isinstance(output_names, (list, tuple, np.ndarray)) else []
     try:
         target_class_idx = class_names.index(predicted_label)
     except ValueError:
         target_class_idx = int(np.argmax([item["score"] for item in prediction_scores]))
 
-    raw_values = np.array(shap_values.values[0])
+    raw_values = np.array(raw_values)
     if raw_values.ndim == 1:
         token_values = raw_values
     else:
@@ -90,39 +128,22 @@ def explain_clause_with_shap(
         target_class_idx = min(max(target_class_idx, 0), max_class_idx)
         token_values = raw_values[:, target_class_idx]
 
-    token_data = shap_values.data[0]
-
-    positive_scores = []
-    negative_scores = []
-
-    def _normalize_token(token: str) -> str:
-        cleaned = token.replace("##", "").strip().lower()
-        cleaned = cleaned.strip(".,;:!?()[]{}\"'`-_/\\")
-        return cleaned
+    # Filter and rank scores in numpy; only the surviving tokens are normalized.
+    values = np.asarray(token_values, dtype=np.float64)[:len(token_data)]
+    keep = ~(np.abs(values) < shap_threshold)
+    is_positive = values > 0
+    positive_idx = np.flatnonzero(keep & is_positive)
+    negative_idx = np.flatnonzero(keep & ~is_positive)
+    # Stable sorts keep equal scores in token order.
+    positive_idx = positive_idx[np.argsort(-values[positive_idx], kind="stable")]
+    negative_idx = negative_idx[np.argsort(values[negative_idx], kind="stable")]
 
-    for token, score in zip(token_data, token_values):
-        raw_token = str(token).strip()
-        t = _normalize_token(raw_token)
-        if not t:
-            continue
-        if t in ENGLISH_STOP_WORDS:
-            continue
-        score_value = float(score)
-        if abs(score_value) < shap_threshold:
-            continue
-        if score_value > 0:
-            positive_scores.append((t, score_value))
-        else:
-            negative_scores.append((t, score_value))
-
-    positive_scores.sort(key=lambda x: x[1], reverse=True)
-    negative_scores.sort(key=lambda x: x[1])
-
-    def _top_unique(items: List[tuple], limit: int) -> List[str]:
+    def _top_unique(indices: np.ndarray, limit: int) -> List[str]:
         seen = set()
         output: List[str] = []
-        for token, _ in items:
-            if token in seen:
+        for idx in indices.tolist():
+            token = _normalize_token(str(token_data[idx]).strip())
+            if not token or token in seen:
                 continue
             seen.add(token)
             output.append(token)
@@ -130,8 +151,8 @@ def explain_clause_with_shap(
                 break
         return output
 
-    top_positive = _top_unique(positive_scores, top_k)
-    top_negative = _top_unique(negative_scores, top_k)
+    top_positive = _top_unique(positive_idx, top_k)
+    top_negative = _top_unique(negative_idx, top_k)
 
     top_tokens: List[str] = []
     for token in top_positive + top_negative:
@@ -158,6 +179,124 @@ def explain_clause_with_shap(
     }
 
 
+def explain_clauses_batch(
+    clauses: List[str],
+    model_dir: str = "models/bert_model",
+    top_k: int = 5,
+    shap_threshold: float = 0.01,
+) -> Dict[str, Dict[str, object]]:
+    """
+    Explain several clauses with a single vectorized SHAP call.
+
+    Previously explained clauses are served from an LRU cache; only the
+    misses are scored and sent through the explainer.
+
+    Returns a dict keyed by clause_hash(clause).
+    """
+    explanations: Dict[str, Dict[str, object]] = {}
+    pending: Dict[str, str] = {}
+
+    for clause in clauses:
+        clause_text = (clause or "").strip()
+        key = clause_hash(clause_text)
+        if not clause_text:
+            explanations[key] = _empty_explanation()
+            continue
+        cached = _cache_get((key, model_dir, top_k, shap_threshold))
+        if cached is not None:
+            explanations[key] = cached
+        else:
+            pending[key] = clause_text
+
+    if not pending:
+        return explanations
+
+    keys = list(pending.keys())
+    texts = [pending[key] for key in keys]
+
+    explainer, score, class_names = _load_explainer(model_dir)
+
+    probs = np.concatenate(
+        [score(texts[start:start + MAX_BATCH_SIZE]) for start in range(0, len(texts), MAX_BATCH_SIZE)]
+    )
+    prediction_rows = [
+        [{"label": name, "score": float(prob)} for name, prob in zip(class_names, row)]
+        for row in probs
+    ]
+
+    shap_values = explainer(texts, batch_size=MAX_BATCH_SIZE)
+
+    for idx, key in enumerate(keys):
+        explanation = _explain_from_shap_row(
+            clause_text=texts[idx],
+            prediction_scores=prediction_rows[idx],
+            class_names=class_names,
+            raw_values=shap_values.values[idx],
+            token_data=shap_values.data[idx],
+            top_k=top_k,
+            shap_threshold=shap_threshold,
+        )
+        _cache_put((key, model_dir, top_k, shap_threshold), explanation)
+        explanations[key] = explanation
+
+    return explanations
+
+
+def explain_clause_with_shap(
+    clause: str,
+    model_dir: str = "models/bert_model",
+    top_k: int = 5,
+    shap_threshold: float = 0.01,
+) -> Dict[str, object]:
+    """
+    Explain BERT prediction for a single clause using SHAP.
+
+    Returns:
+    {
+      "label": "Liability Risk",
+      "top_contributing_words": ["liability", "indemnify", ...]
+    }
+    """
+    clause_text = (clause or "").strip()
+    if not clause_text:
+        return _empty_explanation()
+
+    explanations = explain_clauses_batch(
+        [clause_text],
+        model_dir=model_dir,
+        top_k=top_k,
+        shap_threshold=shap_threshold,
+    )
+    return explanations[clause_hash(clause_text)]
+
+
+def _build_keyword_automaton(keywords: List[str]):
+    automaton = ahocorasick.Automaton()
+    for kw_id, kw in enumerate(keywords):
+        automaton.add_word(kw, kw_id)
+    automaton.make_automaton()
+    return automaton
+
+
+# One automaton per risk label, so matching is a single pass over the clause.
+_HIGH_RISK_AUTOMATA = {} if ahocorasick is None else {
+    label: _build_keyword_automaton(info["high_risk_keywords"])
+    for label, info in RISK_CATEGORIES.items()
+    if info.get("high_risk_keywords")
+}
+
+
+def _matched_high_risk_keywords(clause_lower: str, label: str) -> List[str]:
+    """High-risk keywords of `label` found in the clause, in RISK_CATEGORIES order."""
+    keywords = RISK_CATEGORIES.get(label, {}).get("high_risk_keywords", [])
+    automaton = _HIGH_RISK_AUTOMATA.get(label)
+    if automaton is None:
+        return [kw for kw in keywords if kw in clause_lower]
+
+    hits = {kw_id for _, kw_id in automaton.iter(clause_lower)}
+    return [kw for kw_id, kw in enumerate(keywords) if kw_id in hits]
+
+
 def generate_risk_explanation(
     clause: str,
     label: str,
@@ -184,7 +323,8 @@ def generate_risk_explanation(
     durations = extract_duration(clause)
     
     # Detect high-risk patterns
-    high_risk_detection = detect_high_risk_clause(clause, label)
+    clause_lower = clause.lower()
+    high_risk_detection = detect_high_risk_clause(clause, label, monetary_value, clause_lower)
     risk_triggers = high_risk_detection.get("risk_triggers", [])
     
     # Generate why_flagged explanation
@@ -256,10 +396,7 @@ def generate_risk_explanation(
             risk_factors.append(f"Short notice period: only {days} days")
     
     # Add severity flags from category keywords
-    category_info = RISK_CATEGORIES.get(label, {})
-    high_risk_kws = category_info.get("high_risk_keywords", [])
-    clause_lower = clause.lower()
-    matched_kws = [kw for kw in high_risk_kws if kw in clause_lower]
+    matched_kws = _matched_high_risk_keywords(clause_lower, label)
     
     if matched_kws:
         risk_factors.append(f"Contains high-risk terms: {', '.join(matched_kws[:3])}")
@@ -1,10 +1,25 @@
 import os
+from functools import lru_cache
 from typing import Dict, List
 
+# Must be set before the fast tokenizer is first imported.
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
 import torch
 from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
 from src.category_mapper import enhance_label_with_text_detection
+from src.inference_config import BERT_MODEL_DIR, QUANTIZE_CPU, TORCH_COMPILE
+from src.modeling.bert_model import length_sorted_order
+
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "32"))
+
+# Cap intra-op threads so MKL/OpenMP does not oversubscribe cores shared with
+# the web server; override with TORCH_NUM_THREADS.
+TORCH_NUM_THREADS = int(os.environ.get("TORCH_NUM_THREADS", max(1, (os.cpu_count() or 2) // 2)))
+
+torch.set_float32_matmul_precision("high")
+torch.set_num_threads(TORCH_NUM_THREADS)
 
 
 def assign_severity(label: str, confidence: float) -> str:
@@ -26,12 +41,15 @@ def assign_severity(label: str, confidence: float) -> str:
     return "Low"
 
 
-def load_bert_model(model_dir: str = "models/bert_model"):
+@lru_cache(maxsize=2)
+def load_bert_model(model_dir: str = BERT_MODEL_DIR):
     """
     Load the fine-tuned BERT model and tokenizer from disk.
 
+    Loaded once per process and reused across calls.
+
     Returns:
-        tokenizer, model, device
+        tokenizer, model, device, id2label (tuple of class names by id)
     """
     if not os.path.isdir(model_dir):
         raise FileNotFoundError(f"Model directory not found: {model_dir}")
@@ -43,13 +61,24 @@ def load_bert_model(model_dir: str = "models/bert_model"):
     model.to(device)
     model.eval()
 
-    return tokenizer, model, device
+    label_map = model.config.id2label or {}
+    id2label = tuple(str(label_map.get(idx, idx)) for idx in range(model.config.num_labels))
+
+    if device.type == "cpu" and QUANTIZE_CPU:
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    if TORCH_COMPILE and hasattr(torch, "compile"):
+        # dynamic=True: length-sorted batches vary in sequence length.
+        model = torch.compile(model, dynamic=True)
+
+    return tokenizer, model, device, id2label
 
 
 def infer_clauses(
     clauses: List[str],
-    model_dir: str = "models/bert_model",
+    model_dir: str = BERT_MODEL_DIR,
     max_length: int = 256,
+    batch_size: int = MAX_BATCH_SIZE,
 ) -> List[Dict[str, object]]:
     """
     Run BERT inference on a list of contract clauses.
@@ -58,6 +87,7 @@ def infer_clauses(
         clauses: List of clause texts.
         model_dir: Path to saved BERT model directory.
         max_length: Maximum token length for truncation.
+        batch_size: Clauses per forward pass (defaults to MAX_BATCH_SIZE).
 
     Returns:
         List of dictionaries in format:
@@ -72,50 +102,59 @@ def infer_clauses(
     if not clauses:
         return []
 
-    tokenizer, model, device = load_bert_model(model_dir=model_dir)
+    clause_texts = [(clause or "").strip() for clause in clauses]
+    clause_texts = [text for text in clause_texts if text]
+    if not clause_texts:
+        return []
+
+    tokenizer, model, device, id2label = load_bert_model(model_dir=model_dir)
 
-    results: List[Dict[str, object]] = []
-    with torch.no_grad():
-        for clause in clauses:
-            clause_text = (clause or "").strip()
-            if not clause_text:
-                continue
+    # Smart batching: group clauses of similar token length to minimise padding.
+    order = length_sorted_order(tokenizer, clause_texts, max_length)
 
+    pred_ids: List[int] = [0] * len(clause_texts)
+    confidences: List[float] = [0.0] * len(clause_texts)
+    with torch.inference_mode():
+        for start in range(0, len(order), batch_size):
+            batch_idx = order[start:start + batch_size]
             encoded = tokenizer(
-                clause_text,
+                [clause_texts[idx] for idx in batch_idx],
                 return_tensors="pt",
                 truncation=True,
                 max_length=max_length,
-                padding=False,
+                padding=True,
             )
             encoded = {key: value.to(device) for key, value in encoded.items()}
 
             outputs = model(**encoded)
-            probs = torch.softmax(outputs.logits, dim=-1).squeeze(0)
+            probs = torch.softmax(outputs.logits, dim=-1)
+            batch_conf, batch_pred = probs.max(dim=-1)
 
-            pred_id = int(torch.argmax(probs).item())
-            confidence = float(probs[pred_id].item())
+            for idx, pred_id, confidence in zip(batch_idx, batch_pred.tolist(), batch_conf.tolist()):
+                pred_ids[idx] = int(pred_id)
+                confidences[idx] = float(confidence)
 
-            label_map = model.config.id2label or {}
-            raw_label = str(label_map.get(pred_id, pred_id))
-            
-            # Enhance label with category mapping and text-based detection (includes IP Risk)
-            enhanced_label, adjusted_confidence, detection_method = enhance_label_with_text_detection(
-                raw_label, clause_text, confidence
-            )
-            
-            severity = assign_severity(enhanced_label, adjusted_confidence)
-
-            results.append(
-                {
-                    "clause": clause_text,
-                    "label": enhanced_label,
-                    "raw_label": raw_label,
-                    "confidence": round(adjusted_confidence, 4),
-                    "original_confidence": round(confidence, 4),
-                    "severity": severity,
-                    "detection_method": detection_method,
-                }
-            )
+    results: List[Dict[str, object]] = []
+    for clause_text, pred_id, confidence in zip(clause_texts, pred_ids, confidences):
+        raw_label = id2label[pred_id]
+
+        # Enhance label with category mapping and text-based detection (includes IP Risk)
+        enhanced_label, adjusted_confidence, detection_method = enhance_label_with_text_detection(
+            raw_label, clause_text, confidence
+        )
+
+        severity = assign_severity(enhanced_label, adjusted_confidence)
+
+        results.append(
+            {
+                "clause": clause_text,
+                "label": enhanced_label,
+                "raw_label": raw_label,
+                "confidence": round(adjusted_confidence, 4),
+                "original_confidence": round(confidence, 4),
+                "severity": severity,
+                "detection_method": detection_method,
+            }
+        )
 
     return results
@@ -0,0 +1,16 @@
+"""
+src/inference_config.py
+-----------------------
+Serving settings shared by the inference worker (src/inference.py) and the
+web process, which keys its prediction cache on them. Kept free of torch
+imports so the web process can read them without loading the model stack.
+"""
+import os
+
+BERT_MODEL_DIR = os.path.join("models", "bert_model")
+# Dynamic int8 quantization of the Linear layers when serving on CPU; set
+# QUANTIZE_CPU=0 to keep full FP32 weights.
+QUANTIZE_CPU = os.environ.get("QUANTIZE_CPU", "1") != "0"
+# Opt-in torch.compile of the loaded model (fuses Linear/GELU/LayerNorm). The
+# first batches pay the compile cost, so leave it off for short-lived runs.
+TORCH_COMPILE = os.environ.get("TORCH_COMPILE", "0") == "1"
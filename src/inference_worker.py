@@ -0,0 +1,202 @@
+"""
+src/inference_worker.py
+-----------------------
+Runs the torch-heavy steps (PDF extraction + segmentation + BERT inference,
+and SHAP explanations) in one long-lived worker process.
+
+The web process posts jobs on a multiprocessing queue and waits for the
+result, so request threads never hold the GIL for model work and the models
+are loaded once per machine instead of once per web worker.
+"""
+import atexit
+import itertools
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_TIMEOUT = 120
+# How often the collector checks that the worker is still alive while idle
+_POLL_INTERVAL = 1.0
+
+
+def _extract_and_infer(file_path: str) -> Tuple[List[str], List[Dict[str, object]]]:
+    from src.inference import infer_clauses
+    from src.pdf_extractor import extract_text_from_pdf
+    from src.segmentation import segment_clauses
+
+    raw_text = extract_text_from_pdf(file_path)
+    clauses = segment_clauses(raw_text)
+    return clauses, infer_clauses(clauses)
+
+
+def _explain(clause: str) -> Dict[str, object]:
+    from src.explainability import explain_clause_with_shap
+
+    return explain_clause_with_shap(clause)
+
+
+def _explain_batch(clauses: List[str]) -> Dict[str, Dict[str, object]]:
+    from src.explainability import explain_clauses_batch
+
+    return explain_clauses_batch(clauses)
+
+
+_JOB_HANDLERS: Dict[str, Callable] = {
+    "analyze": _extract_and_infer,
+    "explain": _explain,
+    "explain_batch": _explain_batch,
+}
+
+
+def _worker_main(jobs, results) -> None:
+    """Worker loop: run jobs until a None sentinel arrives or the web process is gone."""
+    parent = multiprocessing.parent_process()
+    while True:
+        try:
+            job = jobs.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            # Not daemonic, so nothing kills it if the parent dies without shutdown()
+            if parent is not None and not parent.is_alive():
+                break
+            continue
+        if job is None:
+            break
+        job_id, kind, args = job
+        try:
+            results.put((job_id, True, _JOB_HANDLERS[kind](*args)))
+        except Exception as exc:
+            results.put((job_id, False, f"{type(exc).__name__}: {exc}"))
+
+
+class InferenceWorker:
+    """Handle to the model-owning worker process."""
+
+    def __init__(self) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        self._jobs = ctx.Queue()
+        self._results = ctx.Queue()
+        # Non-daemonic so extraction can use its own process pool on long PDFs;
+        # stopped by shutdown() (registered with atexit) or when its parent exits
+        self._process = ctx.Process(target=_worker_main, args=(self._jobs, self._results))
+        self._pending: Dict[int, Future] = {}
+        self._closed = False
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+
+        self._process.start()
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    def _collect(self) -> None:
+        """Route results from the worker to the futures waiting on them."""
+        while True:
+            try:
+                job_id, ok, payload = self._results.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+                # Worker is gone (crash, OOM kill, shutdown): nothing else will
+                # arrive, so fail whatever is still waiting and stop collecting
+                self._fail_pending(
+                    f"Inference worker exited (exit code {self._process.exitcode}) before finishing the job"
+                )
+                return
+            with self._lock:
+                future = self._pending.pop(job_id, None)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(payload)
+            else:
+                future.set_exception(RuntimeError(payload))
+
+    def _fail_pending(self, message: str) -> None:
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(RuntimeError(message))
+
+    def _submit(self, kind: str, *args) -> Tuple[int, Future]:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Inference worker is not running")
+            job_id = next(self._ids)
+            self._pending[job_id] = future
+        self._jobs.put((job_id, kind, args))
+        return job_id, future
+
+    def submit(self, kind: str, *args) -> Future:
+        return self._submit(kind, *args)[1]
+
+    def run(self, kind: str, *args, timeout: float = DEFAULT_TIMEOUT):
+        job_id, future = self._submit(kind, *args)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # The single worker would keep running the stuck job with every later
+            # job queued behind it; close the handle first so get_worker() starts
+            # a fresh worker right away, then stop this one (the collector fails
+            # any other jobs it was holding)
+            with self._lock:
+                self._pending.pop(job_id, None)
+                self._closed = True
+            self._process.terminate()
+            self._process.join(timeout=5)
+            raise TimeoutError(f"Inference worker did not finish {kind!r} job within {timeout:g}s") from None
+
+    def is_alive(self) -> bool:
+        # A closed handle may still have a child that has not been reaped yet
+        return not self._closed and self._process.is_alive()
+
+    def shutdown(self) -> None:
+        self._jobs.put(None)
+        self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=5)
+
+
+_worker: Optional[InferenceWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_worker() -> InferenceWorker:
+    """Return the shared worker, starting (or restarting) it on first use."""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            first_start = _worker is None
+            _worker = InferenceWorker()
+            if first_start:
+                # Registered after the first process start so it runs before
+                # multiprocessing's own exit hook (atexit is LIFO), which would
+                # otherwise wait forever on the non-daemonic worker
+                atexit.register(_shutdown_worker)
+        return _worker
+
+
+def _shutdown_worker() -> None:
+    with _worker_lock:
+        if _worker is not None and _worker.is_alive():
+            _worker.shutdown()
+
+
+def extract_and_infer(file_path: str, timeout: float = DEFAULT_TIMEOUT) -> Tuple[List[str], List[Dict[str, object]]]:
+    """Extract, segment, and classify a contract PDF in the worker process."""
+    clauses, predictions = get_worker().run("analyze", file_path, timeout=timeout)
+    return clauses, predictions
+
+
+def explain(clause: str, timeout: float = DEFAULT_TIMEOUT) -> Dict[str, object]:
+    """Run a SHAP explanation for one clause in the worker process."""
+    return get_worker().run("explain", clause, timeout=timeout)
+
+
+def explain_batch(clauses: List[str], timeout: float = DEFAULT_TIMEOUT) -> Dict[str, Dict[str, object]]:
+    """Run SHAP explanations for several clauses in the worker process."""
+    return get_worker().run("explain_batch", clauses, timeout=timeout)
@@ -1,9 +1,15 @@
+import json
+
 import pandas as pd
-from datasets import load_dataset
 
 import requests
 import os
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - falls back to loading the whole file
+    ijson = None
+
 def download_cuad_json(url, target_path):
     if os.path.exists(target_path):
         print(f"File already exists at {target_path}")
@@ -18,6 +24,14 @@ def download_cuad_json(url, target_path):
             f.write(chunk)
     print("Download complete.")
 
+def iter_cuad_documents(path):
+    """Yield CUAD documents one at a time, streaming the JSON when ijson is available."""
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            yield from ijson.items(f, 'data.item')
+        else:
+            yield from json.load(f)['data']
+
 def load_cuad_to_df():
     url = "https://huggingface.co/datasets/theatticusproject/cuad/resolve/main/CUAD_v1/CUAD_v1.json"
     target_path = "data/CUAD_v1.json"
@@ -28,30 +42,22 @@ def load_cuad_to_df():
     download_cuad_json(url, target_path)
     
     print("Loading and parsing JSON...")
-    # Using the datasets library to load local json
-    dataset = load_dataset("json", data_files=target_path, field="data")
-    
-    data_rows = []
+    # Keep only the two output columns; documents are streamed so the full
+    # JSON (and every paragraph context) is never held in memory at once.
+    clause_texts = []
+    categories = []
     
-    for doc in dataset['train']:
-        title = doc.get('title', 'Unknown')
+    for doc in iter_cuad_documents(target_path):
         for paragraph in doc['paragraphs']:
-            context = paragraph['context']
             for qas in paragraph['qas']:
                 category = qas['question']
-                answers = qas['answers']
-                
-                if answers:
-                    for answer in answers:
-                        data_rows.append({
-                            'clause_text': answer['text'],
-                            'original_category': category,
-                            'context': context,
-                            'title': title
-                        })
+                for answer in qas['answers']:
+                    clause_texts.append(answer['text'])
+                    categories.append(category)
     
-    df = pd.DataFrame(data_rows)
-    return df[['clause_text', 'original_category']].copy()
+    # ~41 distinct categories: store them as a categorical so each string is
+    # kept once (and dictionary-encoded in the Parquet output)
+    return pd.DataFrame({'clause_text': clause_texts, 'original_category': pd.Categorical(categories)})
 
 if __name__ == "__main__":
     df = load_cuad_to_df()
@@ -69,5 +75,5 @@ if __name__ == "__main__":
     import os
     if not os.path.exists('data'):
         os.makedirs('data')
-    df.to_csv('data/cuad_processed.csv', index=False)
-    print(f"\nProcessed data saved to 'data/cuad_processed.csv'. Total rows: {len(df)}")
+    df.to_parquet('data/cuad_processed.parquet', index=False, compression='zstd')
+    print(f"\nProcessed data saved to 'data/cuad_processed.parquet'. Total rows: {len(df)}")
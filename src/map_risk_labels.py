@@ -1,5 +1,32 @@
 import pandas as pd
 import os
+import re
+
+# Mapping keywords for each group, checked in order; first match wins
+RISK_MAPPING = {
+    'Termination Risk': [
+        'termination', 'renewal', 'extension', 'post-termination', 
+        'change control'
+    ],
+    'Payment Risk': [
+        'revenue', 'profit sharing', 'price increases', 'minimum commitment', 
+        'volume restriction', 'audit rights'
+    ],
+    'Liability Risk': [
+        'liability', 'indemnification', 'insurance', 'warranty', 
+        'non-compete', 'solicitation', 'no-poach', 'assignment',
+        'covenant', 'cap on', 'exclusivity', 'most-favored nation'
+    ],
+    'Data Privacy Risk': [
+        'non-disclosure', 'confidentiality', 'data privacy'
+    ]
+}
+
+# One precompiled alternation per label instead of a Python any() over keywords
+_RISK_PATTERNS = [
+    (label, re.compile('|'.join(map(re.escape, keywords))))
+    for label, keywords in RISK_MAPPING.items()
+]
 
 def map_cuad_to_risk(category):
     """
@@ -7,34 +34,14 @@ def map_cuad_to_risk(category):
     """
     category_lower = category.lower()
     
-    # Define mapping keywords for each group
-    risk_mapping = {
-        'Termination Risk': [
-            'termination', 'renewal', 'extension', 'post-termination', 
-            'change control'
-        ],
-        'Payment Risk': [
-            'revenue', 'profit sharing', 'price increases', 'minimum commitment', 
-            'volume restriction', 'audit rights'
-        ],
-        'Liability Risk': [
-            'liability', 'indemnification', 'insurance', 'warranty', 
-            'non-compete', 'solicitation', 'no-poach', 'assignment',
-            'covenant', 'cap on', 'exclusivity', 'most-favored nation'
-        ],
-        'Data Privacy Risk': [
-            'non-disclosure', 'confidentiality', 'data privacy'
-        ]
-    }
-    
-    for label, keywords in risk_mapping.items():
-        if any(keyword in category_lower for keyword in keywords):
+    for label, pattern in _RISK_PATTERNS:
+        if pattern.search(category_lower):
             return label
             
     return 'Neutral'
 
 def main():
-    input_file = 'data/cuad_processed.csv'
+    input_file = 'data/cuad_processed.parquet'
     output_file = 'data/cuad_with_risk.csv'
     
     if not os.path.exists(input_file):
@@ -42,10 +49,14 @@ def main():
         return
 
     print(f"Loading data from {input_file}...")
-    df = pd.read_csv(input_file)
+    df = pd.read_parquet(input_file)
     
     print("Mapping categories to risk labels...")
-    df['risk_label'] = df['original_category'].apply(map_cuad_to_risk)
+    # Only ~41 distinct categories, so map each one once and broadcast the result
+    categories = df['original_category'].unique()
+    df['risk_label'] = df['original_category'].map(
+        {category: map_cuad_to_risk(category) for category in categories}
+    )
     
     # Save the updated dataframe
     df.to_csv(output_file, index=False)
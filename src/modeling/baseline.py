@@ -1,45 +1,60 @@
 from typing import Dict, List, Tuple
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline, make_pipeline
+
+
+def build_vectorizer() -> Pipeline:
+    """Vocabulary-free TF-IDF: hashed n-gram counts reweighted by IDF."""
+    return make_pipeline(
+        HashingVectorizer(
+            n_features=2**14,
+            stop_words="english",
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float32,
+        ),
+        TfidfTransformer(),
+    )
 
 
 def train_baseline(
     texts: List[str],
     labels: List[str],
-) -> Tuple[LogisticRegression, TfidfVectorizer]:
-    """Train TF-IDF + Logistic Regression baseline."""
-    vectorizer = TfidfVectorizer(max_features=5000, stop_words="english", ngram_range=(1, 2))
+) -> Tuple[SGDClassifier, Pipeline]:
+    """Train hashed TF-IDF + logistic-loss SGD baseline."""
+    vectorizer = build_vectorizer()
     x_tfidf = vectorizer.fit_transform(texts)
 
-    model = LogisticRegression(max_iter=1000, class_weight="balanced", random_state=42)
+    model = SGDClassifier(loss="log_loss", class_weight="balanced", max_iter=50, n_jobs=-1, random_state=42)
     model.fit(x_tfidf, labels)
 
     return model, vectorizer
 
 
 def baseline_predict(
-    model: LogisticRegression,
-    vectorizer: TfidfVectorizer,
+    model: SGDClassifier,
+    vectorizer: Pipeline,
     texts: List[str],
 ) -> Tuple[List[str], List[float]]:
     """Predict labels and confidence using baseline model."""
     x_tfidf = vectorizer.transform(texts)
-    preds = model.predict(x_tfidf)
     probs = model.predict_proba(x_tfidf)
 
-    confidences: List[float] = []
-    for row_idx, pred_label in enumerate(preds):
-        class_idx = list(model.classes_).index(pred_label)
-        confidences.append(float(probs[row_idx][class_idx]))
+    # predict() is the argmax of the same scores, so derive both from one pass.
+    pred_idx = probs.argmax(axis=1)
+    preds = model.classes_[pred_idx].tolist()
+    confidences = probs[np.arange(len(pred_idx)), pred_idx].tolist()
 
-    return list(preds), confidences
+    return preds, confidences
 
 
 def baseline_predict_proba(
-    model: LogisticRegression,
-    vectorizer: TfidfVectorizer,
+    model: SGDClassifier,
+    vectorizer: Pipeline,
     texts: List[str],
 ) -> np.ndarray:
     """Return full probability distribution for calibration analysis."""
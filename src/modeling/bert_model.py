@@ -1,10 +1,14 @@
+from functools import lru_cache
 from typing import List, Tuple
 
+import numpy as np
 import torch
 from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
 
+@lru_cache(maxsize=4)
 def load_transformer(model_dir: str):
+    """Load tokenizer, model, and device once per model directory."""
     tokenizer = AutoTokenizer.from_pretrained(model_dir)
     model = AutoModelForSequenceClassification.from_pretrained(model_dir)
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -13,6 +17,18 @@ def load_transformer(model_dir: str):
     return tokenizer, model, device
 
 
+def length_sorted_order(tokenizer, texts: List[str], max_length: int) -> List[int]:
+    """Indices of ``texts`` ordered by token length, so batches need little padding."""
+    lengths = [len(ids) for ids in tokenizer(texts, truncation=True, max_length=max_length)["input_ids"]]
+    return sorted(range(len(texts)), key=lengths.__getitem__)
+
+
+def label_array(model) -> np.ndarray:
+    """Class names indexed by prediction id, for vectorized label lookup."""
+    id2label = model.config.id2label or {}
+    return np.asarray([str(id2label.get(idx, idx)) for idx in range(model.config.num_labels)], dtype=object)
+
+
 def predict_with_transformer(
     model_dir: str,
     texts: List[str],
@@ -21,25 +37,30 @@ def predict_with_transformer(
 ) -> Tuple[List[str], List[float], List[List[float]]]:
     """Predict labels, confidences, and probabilities from transformer model."""
     tokenizer, model, device = load_transformer(model_dir)
-    id2label = model.config.id2label or {}
+    if not texts:
+        return [], [], []
+    labels = label_array(model)
 
-    y_pred: List[str] = []
-    confidences: List[float] = []
-    all_probs: List[List[float]] = []
+    sorted_probs: List[np.ndarray] = []
+    order = length_sorted_order(tokenizer, texts, max_length)
 
-    with torch.no_grad():
-        for start in range(0, len(texts), batch_size):
-            batch = texts[start:start + batch_size]
+    with torch.inference_mode():
+        for start in range(0, len(order), batch_size):
+            batch = [texts[idx] for idx in order[start:start + batch_size]]
             encoded = tokenizer(batch, truncation=True, padding=True, max_length=max_length, return_tensors="pt")
             encoded = {k: v.to(device) for k, v in encoded.items()}
             logits = model(**encoded).logits
-            probs = torch.softmax(logits, dim=-1).cpu().numpy()
-            pred_ids = probs.argmax(axis=-1)
+            sorted_probs.append(torch.softmax(logits, dim=-1).cpu().numpy())
+
+    # Rows come out in length order; scatter them back to input order.
+    stacked = np.concatenate(sorted_probs)
+    probs = np.empty_like(stacked)
+    probs[order] = stacked
+    pred_ids = probs.argmax(axis=-1)
 
-            for row_idx, pred_id in enumerate(pred_ids):
-                y_pred.append(str(id2label.get(int(pred_id), int(pred_id))))
-                confidences.append(float(probs[row_idx, pred_id]))
-                all_probs.append(probs[row_idx].tolist())
+    y_pred = labels[pred_ids].tolist()
+    confidences = probs[np.arange(len(texts)), pred_ids].tolist()
+    all_probs = probs.tolist()
 
     return y_pred, confidences, all_probs
 
@@ -55,22 +76,27 @@ def predict_logits(
     tokenizer, model, device = load_transformer(model_dir)
     label2id = model.config.label2id or {}
 
-    y_pred: List[str] = []
-    logits_out: List[torch.Tensor] = []
+    labels = label_array(model)
 
-    with torch.no_grad():
-        for start in range(0, len(texts), batch_size):
-            batch = texts[start:start + batch_size]
+    # Batches run in length order; each one is written straight into its
+    # input-order rows of the preallocated outputs.
+    order = length_sorted_order(tokenizer, texts, max_length)
+    order_idx = torch.tensor(order, dtype=torch.long)
+    stacked_logits = torch.empty((len(texts), model.config.num_labels), dtype=model.dtype)
+    pred_ids = torch.empty(len(texts), dtype=torch.long)
+
+    with torch.inference_mode():
+        for start in range(0, len(order), batch_size):
+            batch_idx = order[start:start + batch_size]
+            batch = [texts[idx] for idx in batch_idx]
             encoded = tokenizer(batch, truncation=True, padding=True, max_length=max_length, return_tensors="pt")
             encoded = {k: v.to(device) for k, v in encoded.items()}
             logits = model(**encoded).logits
             probs = torch.softmax(logits, dim=-1)
-            pred_batch = torch.argmax(probs, dim=-1)
-
-            for pred_id in pred_batch.tolist():
-                y_pred.append(str(model.config.id2label.get(int(pred_id), int(pred_id))))
-            logits_out.append(logits.cpu())
+            rows = order_idx[start:start + batch_size]
+            pred_ids[rows] = torch.argmax(probs, dim=-1).cpu()
+            stacked_logits[rows] = logits.cpu()
 
-    stacked_logits = torch.cat(logits_out, dim=0)
+    y_pred = labels[pred_ids.numpy()].tolist()
     label_ids = [label2id.get(label, -1) for label in true_labels]
     return y_pred, label_ids, stacked_logits, label2id
@@ -3,7 +3,7 @@ import os
 import argparse
 import sys
 # Import from predict to reuse loading logic
-from predict import load_model_assets, predict_risk
+from predict import load_model_assets, predict_risks
 
 def analyze_pdf(pdf_path, model, tfidf):
     """
@@ -14,7 +14,8 @@ def analyze_pdf(pdf_path, model, tfidf):
         return
         
     print(f"Analyzing PDF: {pdf_path}...")
-    findings = []
+    paragraphs = []
+    page_of = []
     
     with pdfplumber.open(pdf_path) as pdf:
         for i, page in enumerate(pdf.pages):
@@ -23,17 +24,24 @@ def analyze_pdf(pdf_path, model, tfidf):
                 continue
                 
             # Split by double newline or common paragraph starters to approximate clauses
-            paragraphs = [p.strip() for p in text.split('\n\n') if len(p.strip()) > 20]
-            
-            for p in paragraphs:
-                label, confidence = predict_risk(p, model, tfidf)
-                if label != 'Neutral':
-                    findings.append({
-                        'page': i + 1,
-                        'text': p[:200] + "...",
-                        'risk_label': label,
-                        'confidence': confidence
-                    })
+            for p in text.split('\n\n'):
+                p = p.strip()
+                if len(p) > 20:
+                    paragraphs.append(p)
+                    page_of.append(i + 1)
+    
+    # Classify every paragraph in one vectorizer/model call, then map back to pages
+    labels, confidences = predict_risks(paragraphs, model, tfidf)
+    
+    findings = []
+    for page, p, label, confidence in zip(page_of, paragraphs, labels, confidences):
+        if label != 'Neutral':
+            findings.append({
+                'page': page,
+                'text': p[:200] + "...",
+                'risk_label': label,
+                'confidence': confidence
+            })
                     
     return findings
 
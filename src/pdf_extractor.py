@@ -3,16 +3,77 @@ src/pdf_extractor.py
 --------------------
 Utility for extracting clean raw text from contract PDF files.
 """
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+
 import pdfplumber
+from pdfminer.high_level import extract_text as pdfminer_extract_text
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # pragma: no cover - optional fast path
+    fitz = None
+
+_MULTI_SPACE = re.compile(r"[ \t]+")
+_MULTI_NEWLINE = re.compile(r"\n{3,}")
+
+# pdfminer/pdfplumber are pure Python, so long documents are split into page
+# blocks and extracted in a process pool.
+_PARALLEL_MIN_PAGES = 20
+_PAGE_BLOCK = 10
+
+
+def _clean_page_lines(page_text: str) -> str:
+    """Collapse runs of spaces/tabs (a lone tab becomes a space) and rstrip every line."""
+    return "\n".join(map(str.rstrip, _MULTI_SPACE.sub(" ", page_text).splitlines()))
+
+
+def _extract_pages_pymupdf(pdf_path: str) -> list:
+    """Extract per-page text with the MuPDF C engine."""
+    with fitz.open(pdf_path) as doc:
+        return [text for text in (page.get_text("text") for page in doc) if text.strip()]
+
+
+def _extract_page_block_pdfminer(pdf_path: str, start: int, stop: int) -> list:
+    """pdfminer.six text for pages [start, stop), skipping pdfplumber's layout layer."""
+    text = pdfminer_extract_text(pdf_path, page_numbers=range(start, stop))
+    # pdfminer terminates every page with a form feed
+    return [page for page in text.split("\f") if page.strip()]
+
 
+def _extract_page_block_pdfplumber(pdf_path: str, start: int, stop: int) -> list:
+    """pdfplumber text for pages [start, stop); each worker reopens the PDF."""
+    with pdfplumber.open(pdf_path, pages=list(range(start + 1, stop + 1))) as pdf:
+        return [text for text in (page.extract_text() for page in pdf.pages) if text]
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+
+def _extract_pages_pure_python(pdf_path: str, extract_block) -> list:
+    """Run a page-block extractor over the whole PDF, in parallel for long documents."""
+    with pdfplumber.open(pdf_path) as pdf:
+        n_pages = len(pdf.pages)
+
+    # Daemonic processes cannot start a pool; the inference worker is not daemonic.
+    if n_pages < _PARALLEL_MIN_PAGES or multiprocessing.current_process().daemon:
+        return extract_block(pdf_path, 0, n_pages)
+
+    starts = range(0, n_pages, _PAGE_BLOCK)
+    stops = [min(start + _PAGE_BLOCK, n_pages) for start in starts]
+    workers = min(os.cpu_count() or 1, len(stops))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        blocks = pool.map(extract_block, [pdf_path] * len(stops), starts, stops)
+        return [text for block in blocks for text in block]
+
+
+def extract_text_from_pdf(pdf_path: str, fast: bool = True) -> str:
     """
     Extract and clean the full text of a contract PDF.
 
     Steps:
-    1. Open the PDF with pdfplumber.
+    1. Open the PDF with PyMuPDF when installed. If it is missing or
+       finds no text, use pdfminer.six directly (``fast=True``) and then
+       pdfplumber, which is slower but applies its own layout handling.
     2. Extract text from every page.
     3. Strip extra whitespace: collapse runs of spaces/tabs,
        preserve meaningful paragraph breaks (double newlines),
@@ -20,6 +81,7 @@ def extract_text_from_pdf(pdf_path: str) -> str:
 
     Args:
         pdf_path: Absolute or relative path to the PDF file.
+        fast: Try plain pdfminer.six text extraction before pdfplumber.
 
     Returns:
         A single cleaned string containing the full contract text.
@@ -28,37 +90,29 @@ def extract_text_from_pdf(pdf_path: str) -> str:
         FileNotFoundError: if the file does not exist.
         ValueError: if no text could be extracted.
     """
-    import os
     if not os.path.exists(pdf_path):
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    page_texts = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                page_texts.append(page_text)
+    page_texts = _extract_pages_pymupdf(pdf_path) if fitz is not None else []
+    if not page_texts and fast:
+        page_texts = _extract_pages_pure_python(pdf_path, _extract_page_block_pdfminer)
+    if not page_texts:
+        page_texts = _extract_pages_pure_python(pdf_path, _extract_page_block_pdfplumber)
 
     if not page_texts:
         raise ValueError(f"No extractable text found in: {pdf_path}")
 
-    # Join pages with a paragraph separator
-    raw = "\n\n".join(page_texts)
-
     # --- Cleaning pipeline ---
-    # 1. Replace tabs with spaces
-    text = raw.replace("\t", " ")
-
-    # 2. Collapse multiple spaces / non-newline whitespace within a line
-    text = re.sub(r"[ \t]+", " ", text)
-
-    # 3. Remove trailing whitespace on each line
-    text = "\n".join(line.rstrip() for line in text.splitlines())
+    # 1-2. Per page: collapse space/tab runs and strip trailing whitespace
+    #      from each line. Both are line-local, so cleaning page by page and
+    #      joining with a paragraph separator gives the same text as cleaning
+    #      the joined document, without the intermediate full-size copies.
+    text = "\n\n".join(map(_clean_page_lines, page_texts))
 
-    # 4. Collapse 3+ consecutive newlines into exactly 2 (paragraph break)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # 3. Collapse 3+ consecutive newlines into exactly 2 (paragraph break)
+    text = _MULTI_NEWLINE.sub("\n\n", text)
 
-    # 5. Strip leading / trailing whitespace from the whole document
+    # 4. Strip leading / trailing whitespace from the whole document
     text = text.strip()
 
     return text
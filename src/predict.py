@@ -1,7 +1,10 @@
 import joblib
+import numpy as np
 import os
 import argparse
+from functools import lru_cache
 
+@lru_cache(maxsize=2)
 def load_model_assets(model_dir='models'):
     model_path = os.path.join(model_dir, 'baseline_logistic_regression.joblib')
     tfidf_path = os.path.join(model_dir, 'tfidf_vectorizer.joblib')
@@ -11,24 +14,44 @@ def load_model_assets(model_dir='models'):
         
     model = joblib.load(model_path)
     tfidf = joblib.load(tfidf_path)
+    
+    # Inference only: float32 features and weights halve the bytes moved by
+    # the sparse x dense scoring product
+    if hasattr(tfidf, 'dtype'):
+        tfidf.dtype = np.float32
+    model.coef_ = model.coef_.astype(np.float32)
+    model.intercept_ = model.intercept_.astype(np.float32)
     return model, tfidf
 
 def predict_risk(text, model, tfidf):
     """
     Predicts the risk label and confidence for a given clause text.
     """
-    if not text.strip():
-        return "Neutral", 0.0
-        
-    X_tfidf = tfidf.transform([text])
-    prediction = model.predict(X_tfidf)[0]
-    
-    # Get probability/confidence
-    probabilities = model.predict_proba(X_tfidf)[0]
-    class_idx = list(model.classes_).index(prediction)
-    confidence = probabilities[class_idx]
-    
-    return prediction, confidence
+    # One predict_proba pass; its argmax is the label predict() would return
+    labels, confidences = predict_risks([text], model, tfidf)
+    return labels[0], confidences[0]
+
+def predict_risks(texts, model, tfidf):
+    """
+    Batched predict_risk: vectorizes all non-blank texts in one transform
+    call and returns parallel lists of labels and confidences. Blank texts
+    get ("Neutral", 0.0), as in predict_risk.
+    """
+    labels = ["Neutral"] * len(texts)
+    confidences = [0.0] * len(texts)
+    rows = [i for i, text in enumerate(texts) if text.strip()]
+    if not rows:
+        return labels, confidences
+
+    probabilities = model.predict_proba(tfidf.transform([texts[i] for i in rows]))
+    class_idx = probabilities.argmax(axis=1)
+    row_labels = model.classes_[class_idx].tolist()
+    row_confidences = probabilities[range(len(rows)), class_idx].tolist()
+    for i, label, confidence in zip(rows, row_labels, row_confidences):
+        labels[i] = label
+        confidences[i] = confidence
+
+    return labels, confidences
 
 def main():
     parser = argparse.ArgumentParser(description="Predict risk label for a clause text.")
@@ -8,6 +8,8 @@ Implements sophisticated risk scoring with:
 - High-risk clause detection rules
 """
 
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Dict, List, Tuple
 import re
 
@@ -75,6 +77,62 @@ RISK_CATEGORIES = {
     }
 }
 
+# Flat per-label views of RISK_CATEGORIES for the per-clause hot path
+_BASE_IMPACT = {label: info["base_impact"] for label, info in RISK_CATEGORIES.items()}
+_HIGH_RISK_KEYWORDS = {label: tuple(info["high_risk_keywords"]) for label, info in RISK_CATEGORIES.items()}
+
+
+# Precompiled extraction patterns (hoisted out of the per-clause hot path).
+# Each is paired with a literal every match must contain, so clauses without
+# it skip the regex scan entirely (None = always scan).
+_CURRENCY_PATTERNS = [
+    ('$', re.compile(r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', re.IGNORECASE)),           # $100,000.00
+    ('$', re.compile(r'\$\s*(\d+\.?\d*)\s*(million|billion|thousand)', re.IGNORECASE)),   # $1.5 million
+    (None, re.compile(r'usd\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', re.IGNORECASE)),         # USD 100,000
+    ('dollar', re.compile(r'(\d{1,3}(?:,\d{3})*)\s*dollars', re.IGNORECASE)),            # 100,000 dollars
+    ('$', re.compile(r'\$\s*(\d+)k', re.IGNORECASE)),                                      # $100k
+]
+
+_TEXT_NUMBER_PATTERNS = {
+    word: (re.compile(rf'(\d+)\s+{word}'), multiplier)
+    for word, multiplier in (
+        ('hundred', 100),
+        ('thousand', 1_000),
+        ('million', 1_000_000),
+        ('billion', 1_000_000_000),
+    )
+}
+
+_DAY_PATTERNS = [
+    re.compile(r'(\d+)\s*(?:calendar\s+)?days?'),
+    re.compile(r'(\d+)\s*(?:-|\s)day'),
+]
+_MONTH_PATTERNS = [
+    re.compile(r'(\d+)\s*months?'),
+    re.compile(r'(\d+)\s*(?:-|\s)month'),
+]
+_YEAR_PATTERNS = [
+    re.compile(r'(\d+)\s*years?'),
+    re.compile(r'(\d+)\s*(?:-|\s)year'),
+]
+_NOTICE_PATTERNS = [
+    re.compile(r'(?:upon|with|provide|giving?)\s+(\d+)\s*(?:calendar\s+)?days?\s+(?:prior\s+)?notice'),
+    re.compile(r'notice\s+of\s+(\d+)\s*days?'),
+    re.compile(r'(\d+)\s*(?:-|\s)day\s+notice'),
+]
+_DURATION_PATTERNS = (
+    ("days", "day", _DAY_PATTERNS),
+    ("months", "month", _MONTH_PATTERNS),
+    ("years", "year", _YEAR_PATTERNS),
+    ("notice_period_days", "notice", _NOTICE_PATTERNS),
+)
+_DURATION_KEYS = tuple(key for key, _, _ in _DURATION_PATTERNS)
+
+# Boilerplate clauses recur within and across contracts, and both the scorer
+# and the explanation builder extract from the same clause, so the pure
+# text-only extractors are memoized.
+_EXTRACTION_CACHE_SIZE = 4096
+
 
 # Financial exposure multipliers
 EXPOSURE_MULTIPLIERS = {
@@ -84,7 +142,34 @@ EXPOSURE_MULTIPLIERS = {
     "low": 1.0,           # <$25k or no amount
 }
 
+# Lower bounds (inclusive) of the medium/high/critical exposure bands
+_EXPOSURE_THRESHOLDS = (25000, 100000, 500000)
+_EXPOSURE_LEVELS = ("low", "medium", "high", "critical")
+
+# Keyword groups for the exposure, calibration and high-risk rules
+_ENFORCEABILITY_TERMS = ('shall', 'must', 'will', 'obligated', 'required', 'agrees to')
+_NEGATION_TERMS = ('not', 'except', 'unless', 'excluding', 'notwithstanding')
+_UNCAPPED_EXPOSURE_TERMS = ('uncapped', 'unlimited', 'no limit', 'without limit')
+_IMMEDIATE_TERMINATION_TERMS = ('immediate', 'immediately', 'without notice')
+_CONVENIENCE_TERMINATION_TERMS = ('for convenience', 'without cause', 'at any time')
+_PENALTY_TERMS = ('liquidated damages', 'penalty', 'late fee')
+_INDEMNIFICATION_TERMS = ('indemnif', 'hold harmless', 'defend')
+_UNCAPPED_INDEMNITY_TERMS = ('uncapped', 'unlimited', 'no limit')
+_PII_TERMS = ('pii', 'personal data', 'personally identifiable')
+_PRIVACY_REGULATION_TERMS = ('gdpr', 'ccpa', 'data protection regulation')
+_IP_TRANSFER_TERMS = ('ownership', 'assign', 'transfer')
+_PERPETUAL_LICENSE_TERMS = ('perpetual', 'irrevocable')
+
+
+def _contains_any(text_lower: str, terms: Tuple[str, ...]) -> bool:
+    """Plain-loop any(): avoids building a generator for every keyword check."""
+    for term in terms:
+        if term in text_lower:
+            return True
+    return False
 
+
+@lru_cache(maxsize=_EXTRACTION_CACHE_SIZE)
 def extract_monetary_value(text: str) -> float:
     """
     Extract monetary amounts from clause text using NLP patterns.
@@ -102,17 +187,10 @@ def extract_monetary_value(text: str) -> float:
     amounts = []
     
     # Pattern 1: $X,XXX,XXX or $X.X million/billion
-    currency_patterns = [
-        r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',           # $100,000.00
-        r'\$\s*(\d+\.?\d*)\s*(million|billion|thousand)',   # $1.5 million
-        r'usd\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',         # USD 100,000
-        r'(\d{1,3}(?:,\d{3})*)\s*dollars',                  # 100,000 dollars
-        r'\$\s*(\d+)k',                                      # $100k
-    ]
-    
-    for pattern in currency_patterns:
-        matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-        for match in matches:
+    for required, pattern in _CURRENCY_PATTERNS:
+        if required is not None and required not in text_lower:
+            continue
+        for match in pattern.finditer(text_lower):
             try:
                 amount_str = match.group(1).replace(',', '')
                 amount = float(amount_str)
@@ -136,21 +214,14 @@ def extract_monetary_value(text: str) -> float:
                 continue
     
     # Pattern 2: Text numbers (one hundred thousand)
-    text_number_map = {
-        'hundred': 100,
-        'thousand': 1_000,
-        'million': 1_000_000,
-        'billion': 1_000_000_000,
-    }
-    
-    for word, multiplier in text_number_map.items():
-        if word in text_lower and 'dollar' in text_lower:
-            # Simple heuristic: extract digit before the word
-            pattern = rf'(\d+)\s+{word}'
-            match = re.search(pattern, text_lower)
-            if match:
-                base = float(match.group(1))
-                amounts.append(base * multiplier)
+    if 'dollar' in text_lower:
+        for word, (pattern, multiplier) in _TEXT_NUMBER_PATTERNS.items():
+            if word in text_lower:
+                # Simple heuristic: extract digit before the word
+                match = pattern.search(text_lower)
+                if match:
+                    base = float(match.group(1))
+                    amounts.append(base * multiplier)
     
     return max(amounts) if amounts else 0.0
 
@@ -167,59 +238,34 @@ def extract_duration(text: str) -> Dict[str, int]:
         "notice_period_days": 60
     }
     """
+    # Fresh dict per call; only the immutable tuple is cached
+    return dict(zip(_DURATION_KEYS, _extract_duration_values(text)))
+
+
+@lru_cache(maxsize=_EXTRACTION_CACHE_SIZE)
+def _extract_duration_values(text: str) -> Tuple[int, int, int, int]:
+    """Longest days/months/years/notice durations, in _DURATION_KEYS order."""
     text_lower = text.lower()
-    durations = {
-        "days": 0,
-        "months": 0,
-        "years": 0,
-        "notice_period_days": 0
-    }
-    
-    # Extract days
-    day_patterns = [
-        r'(\d+)\s*(?:calendar\s+)?days?',
-        r'(\d+)\s*(?:-|\s)day',
-    ]
-    for pattern in day_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            durations["days"] = max(durations["days"], int(match.group(1)))
-    
-    # Extract months
-    month_patterns = [
-        r'(\d+)\s*months?',
-        r'(\d+)\s*(?:-|\s)month',
-    ]
-    for pattern in month_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            durations["months"] = max(durations["months"], int(match.group(1)))
-    
-    # Extract years
-    year_patterns = [
-        r'(\d+)\s*years?',
-        r'(\d+)\s*(?:-|\s)year',
-    ]
-    for pattern in year_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            durations["years"] = max(durations["years"], int(match.group(1)))
-    
-    # Extract notice periods
-    notice_patterns = [
-        r'(?:upon|with|provide|giving?)\s+(\d+)\s*(?:calendar\s+)?days?\s+(?:prior\s+)?notice',
-        r'notice\s+of\s+(\d+)\s*days?',
-        r'(\d+)\s*(?:-|\s)day\s+notice',
-    ]
-    for pattern in notice_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            durations["notice_period_days"] = max(durations["notice_period_days"], int(match.group(1)))
-    
-    return durations
-
-
-def calculate_financial_exposure_factor(text: str, label: str, monetary_value: float = None) -> Tuple[str, float]:
+    values = []
+    
+    for _, required, patterns in _DURATION_PATTERNS:
+        value = 0
+        if required in text_lower:
+            for pattern in patterns:
+                match = pattern.search(text_lower)
+                if match:
+                    value = max(value, int(match.group(1)))
+        values.append(value)
+    
+    return tuple(values)
+
+
+def calculate_financial_exposure_factor(
+    text: str,
+    label: str,
+    monetary_value: float = None,
+    text_lower: str = None
+) -> Tuple[str, float]:
     """
     Determine financial exposure level and multiplier.
     
@@ -227,6 +273,7 @@ def calculate_financial_exposure_factor(text: str, label: str, monetary_value: f
         text: Clause text
         label: Risk category label
         monetary_value: Extracted monetary amount (optional, will extract if not provided)
+        text_lower: Lowercased clause text (optional, computed if not provided)
     
     Returns:
         (exposure_level, multiplier)
@@ -235,25 +282,16 @@ def calculate_financial_exposure_factor(text: str, label: str, monetary_value: f
     if monetary_value is None:
         monetary_value = extract_monetary_value(text)
     
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     
     # Check for uncapped/unlimited liability
-    if any(keyword in text_lower for keyword in ['uncapped', 'unlimited', 'no limit', 'without limit']):
+    if _contains_any(text_lower, _UNCAPPED_EXPOSURE_TERMS):
         return ("critical", EXPOSURE_MULTIPLIERS["critical"])
     
-    # Get category-specific threshold
-    category_info = RISK_CATEGORIES.get(label, {})
-    threshold = category_info.get("financial_threshold", 100000)
-    
     # Classify based on amount
-    if monetary_value >= 500000:
-        return ("critical", EXPOSURE_MULTIPLIERS["critical"])
-    elif monetary_value >= 100000:
-        return ("high", EXPOSURE_MULTIPLIERS["high"])
-    elif monetary_value >= 25000:
-        return ("medium", EXPOSURE_MULTIPLIERS["medium"])
-    else:
-        return ("low", EXPOSURE_MULTIPLIERS["low"])
+    level = _EXPOSURE_LEVELS[bisect_right(_EXPOSURE_THRESHOLDS, monetary_value)]
+    return (level, EXPOSURE_MULTIPLIERS[level])
 
 
 def calibrate_confidence(
@@ -261,7 +299,8 @@ def calibrate_confidence(
     label: str,
     text: str,
     monetary_value: float = None,
-    context_signals: Dict[str, bool] = None
+    context_signals: Dict[str, bool] = None,
+    text_lower: str = None
 ) -> Tuple[float, Dict[str, object]]:
     """
     Calibrate model confidence based on contextual signals.
@@ -281,9 +320,9 @@ def calibrate_confidence(
     calibrated = base_confidence
     adjustments = []
     
-    text_lower = text.lower()
-    category_info = RISK_CATEGORIES.get(label, {})
-    keywords = category_info.get("high_risk_keywords", [])
+    if text_lower is None:
+        text_lower = text.lower()
+    keywords = _HIGH_RISK_KEYWORDS.get(label, ())
     
     # 1. Keyword signal strength
     keyword_matches = sum(1 for kw in keywords if kw in text_lower)
@@ -303,22 +342,21 @@ def calibrate_confidence(
         adjustments.append({"factor": "Explicit financial amount", "adjustment": +0.08})
     
     # 3. Enforceability signals (legal language strength)
-    enforceability_terms = ['shall', 'must', 'will', 'obligated', 'required', 'agrees to']
-    if any(term in text_lower for term in enforceability_terms):
+    if _contains_any(text_lower, _ENFORCEABILITY_TERMS):
         calibrated = min(calibrated + 0.05, 1.0)
         adjustments.append({"factor": "Strong enforceability language", "adjustment": +0.05})
     
     # 4. Specificity check (longer, more detailed clauses)
-    if len(text.split()) > 50:
+    word_count = len(text.split())
+    if word_count > 50:
         calibrated = min(calibrated + 0.03, 1.0)
         adjustments.append({"factor": "Detailed clause (high specificity)", "adjustment": +0.03})
-    elif len(text.split()) < 15:
+    elif word_count < 15:
         calibrated = max(calibrated - 0.05, 0.0)
         adjustments.append({"factor": "Short clause (low specificity)", "adjustment": -0.05})
     
     # 5. Negation check (reduces confidence)
-    negation_terms = ['not', 'except', 'unless', 'excluding', 'notwithstanding']
-    if any(term in text_lower for term in negation_terms):
+    if _contains_any(text_lower, _NEGATION_TERMS):
         calibrated = max(calibrated - 0.07, 0.0)
         adjustments.append({"factor": "Negation/exception language", "adjustment": -0.07})
     
@@ -333,10 +371,21 @@ def calibrate_confidence(
     return round(calibrated, 4), calibration_details
 
 
-def detect_high_risk_clause(text: str, label: str) -> Dict[str, object]:
+def detect_high_risk_clause(
+    text: str,
+    label: str,
+    monetary_value: float = None,
+    text_lower: str = None
+) -> Dict[str, object]:
     """
     Apply high-risk detection rules for specific clause types.
     
+    Args:
+        text: Clause text
+        label: Risk category label
+        monetary_value: Extracted monetary amount (optional, extracted on demand if not provided)
+        text_lower: Lowercased clause text (optional, computed if not provided)
+    
     Returns:
     {
         "is_high_risk": True/False,
@@ -344,16 +393,17 @@ def detect_high_risk_clause(text: str, label: str) -> Dict[str, object]:
         "severity_override": "High"  # or None
     }
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     risk_triggers = []
     is_high_risk = False
     
     # Rule 1: Termination triggers (immediate or convenience)
     if label == "Termination Risk":
-        if any(term in text_lower for term in ['immediate', 'immediately', 'without notice']):
+        if _contains_any(text_lower, _IMMEDIATE_TERMINATION_TERMS):
             risk_triggers.append("Immediate termination allowed")
             is_high_risk = True
-        if any(term in text_lower for term in ['for convenience', 'without cause', 'at any time']):
+        if _contains_any(text_lower, _CONVENIENCE_TERMINATION_TERMS):
             risk_triggers.append("Termination for convenience")
             is_high_risk = True
         if 'no cure' in text_lower or 'without opportunity to cure' in text_lower:
@@ -362,32 +412,34 @@ def detect_high_risk_clause(text: str, label: str) -> Dict[str, object]:
     
     # Rule 2: Liquidated damages, penalties, late payments
     if label in ["Payment Risk", "Liability Risk"]:
-        if any(term in text_lower for term in ['liquidated damages', 'penalty', 'late fee']):
+        if _contains_any(text_lower, _PENALTY_TERMS):
             risk_triggers.append("Liquidated damages or penalties")
             is_high_risk = True
         
-        monetary_value = extract_monetary_value(text)
+        if monetary_value is None:
+            monetary_value = extract_monetary_value(text)
         if monetary_value >= 100000:
             risk_triggers.append(f"High financial exposure (${monetary_value:,.0f})")
             is_high_risk = True
     
     # Rule 3: Indemnification >$100k or uncapped
     if label == "Liability Risk":
-        if any(term in text_lower for term in ['indemnif', 'hold harmless', 'defend']):
-            monetary_value = extract_monetary_value(text)
+        if _contains_any(text_lower, _INDEMNIFICATION_TERMS):
+            if monetary_value is None:
+                monetary_value = extract_monetary_value(text)
             if monetary_value >= 100000:
                 risk_triggers.append(f"Indemnification obligation >${monetary_value:,.0f}")
                 is_high_risk = True
-            if any(term in text_lower for term in ['uncapped', 'unlimited', 'no limit']):
+            if _contains_any(text_lower, _UNCAPPED_INDEMNITY_TERMS):
                 risk_triggers.append("Uncapped indemnification liability")
                 is_high_risk = True
     
     # Rule 4: Data privacy & regulatory (PII, GDPR/CCPA)
     if label == "Data Privacy Risk":
-        if any(term in text_lower for term in ['pii', 'personal data', 'personally identifiable']):
+        if _contains_any(text_lower, _PII_TERMS):
             risk_triggers.append("PII/personal data handling required")
             is_high_risk = True
-        if any(term in text_lower for term in ['gdpr', 'ccpa', 'data protection regulation']):
+        if _contains_any(text_lower, _PRIVACY_REGULATION_TERMS):
             risk_triggers.append("GDPR/CCPA compliance obligations")
             is_high_risk = True
         if 'data breach' in text_lower:
@@ -396,10 +448,10 @@ def detect_high_risk_clause(text: str, label: str) -> Dict[str, object]:
     
     # Rule 5: IP ownership, licensing, infringement
     if label == "IP Risk":
-        if any(term in text_lower for term in ['ownership', 'assign', 'transfer']):
+        if _contains_any(text_lower, _IP_TRANSFER_TERMS):
             risk_triggers.append("IP ownership transfer or assignment")
             is_high_risk = True
-        if any(term in text_lower for term in ['perpetual', 'irrevocable']):
+        if _contains_any(text_lower, _PERPETUAL_LICENSE_TERMS):
             risk_triggers.append("Perpetual or irrevocable license grant")
             is_high_risk = True
         if 'infringement' in text_lower:
@@ -436,22 +488,24 @@ def compute_advanced_risk_score(
     monetary_value = extract_monetary_value(text)
     durations = extract_duration(text)
     
+    # Lowercase once for all keyword checks below
+    text_lower = text.lower()
+    
     # Calibrate confidence based on context
     if calibrate:
         calibrated_confidence, calibration_details = calibrate_confidence(
-            base_confidence, label, text, monetary_value
+            base_confidence, label, text, monetary_value, text_lower=text_lower
         )
     else:
         calibrated_confidence = base_confidence
         calibration_details = {"original_confidence": base_confidence}
     
     # Get category-specific impact weight
-    category_info = RISK_CATEGORIES.get(label, RISK_CATEGORIES["Neutral"])
-    base_impact = category_info["base_impact"]
+    base_impact = _BASE_IMPACT.get(label, _BASE_IMPACT["Neutral"])
     
     # Calculate financial exposure factor
     exposure_level, exposure_multiplier = calculate_financial_exposure_factor(
-        text, label, monetary_value
+        text, label, monetary_value, text_lower
     )
     
     # Final impact with exposure adjustment
@@ -464,7 +518,7 @@ def compute_advanced_risk_score(
     severity_score = round(adjusted_impact * likelihood, 4)
     
     # Detect high-risk patterns
-    high_risk_detection = detect_high_risk_clause(text, label)
+    high_risk_detection = detect_high_risk_clause(text, label, monetary_value, text_lower)
     
     # Determine final severity category
     if high_risk_detection["severity_override"]:
@@ -514,6 +568,8 @@ def attach_advanced_risk_scores(results: List[Dict[str, object]]) -> Tuple[List[
     enriched = []
     total_score = 0.0
     max_possible = 0.0
+    high_risk_count = 0
+    calibrated_clauses = 0
     
     for item in results:
         clause = str(item.get("clause", "")).strip()
@@ -539,6 +595,10 @@ def attach_advanced_risk_scores(results: List[Dict[str, object]]) -> Tuple[List[
         # Accumulate for overall score
         total_score += risk_assessment["severity_score"]
         max_possible += risk_assessment["adjusted_impact"]
+        if risk_assessment["high_risk_detection"]["is_high_risk"]:
+            high_risk_count += 1
+        if risk_assessment["calibration_details"].get("adjustments"):
+            calibrated_clauses += 1
     
     # Normalize overall score to 0-100
     normalized_score = round((total_score / max_possible) * 100, 2) if max_possible > 0 else 0.0
@@ -548,10 +608,10 @@ def attach_advanced_risk_scores(results: List[Dict[str, object]]) -> Tuple[List[
         "total_severity_score": round(total_score, 4),
         "max_possible_score": round(max_possible, 4),
         "normalized_score": normalized_score,
-        "category_weights": {k: v["base_impact"] for k, v in RISK_CATEGORIES.items()},
+        "category_weights": dict(_BASE_IMPACT),
         "exposure_multipliers": EXPOSURE_MULTIPLIERS,
-        "high_risk_count": sum(1 for item in enriched if item.get("high_risk_detection", {}).get("is_high_risk")),
-        "calibrated_clauses": sum(1 for item in enriched if item.get("calibration_details", {}).get("adjustments")),
+        "high_risk_count": high_risk_count,
+        "calibrated_clauses": calibrated_clauses,
     }
     
     return enriched, breakdown
@@ -5,7 +5,397 @@ Provides actionable recommendations for reducing contract risk exposure
 based on clause type, severity, and specific risk triggers.
 """
 
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+
+
+# Strategies with fixed text are shared read-only singletons; only the entries
+# that interpolate clause values are built per call.
+_CAP_LIABILITY = MappingProxyType({
+    "priority": "Critical",
+    "strategy": "Cap Liability",
+    "action": "Negotiate a liability cap (e.g., 1x or 2x annual contract value) to limit maximum exposure.",
+    "rationale": "Uncapped liability creates unlimited financial risk. Industry standard is to cap at a multiple of fees paid."
+})
+
+_ADD_EXCLUSIONS = MappingProxyType({
+    "priority": "Critical",
+    "strategy": "Add Exclusions",
+    "action": "Exclude liability for consequential, indirect, or punitive damages unless explicitly required.",
+    "rationale": "Consequential damages can far exceed direct contract value."
+})
+
+_MUTUAL_INDEMNIFICATION = MappingProxyType({
+    "priority": "High",
+    "strategy": "Mutual Indemnification",
+    "action": "Negotiate mutual indemnification obligations to balance risk between parties.",
+    "rationale": "One-sided indemnification creates asymmetric risk exposure."
+})
+
+_ADD_CARVE_OUTS = MappingProxyType({
+    "priority": "Medium",
+    "strategy": "Add Carve-Outs",
+    "action": "Exclude indemnification for third-party claims arising from other party's actions or IP.",
+    "rationale": "Limits scope of indemnification to your direct actions only."
+})
+
+_LEGAL_REVIEW_REQUIRED = MappingProxyType({
+    "priority": "High",
+    "strategy": "Legal Review Required",
+    "action": "Have legal counsel review liability provisions before signing.",
+    "rationale": "High-severity liability clauses require expert interpretation and negotiation."
+})
+
+
+def _liability_strategies(
+    severity: str,
+    triggers_text: str,
+    monetary_value: float,
+    durations: Dict[str, int]
+) -> List[Mapping[str, str]]:
+    """Liability caps, exclusions, insurance, and balanced indemnification."""
+    strategies = []
+    
+    if "uncapped" in triggers_text or "unlimited" in triggers_text:
+        strategies.append(_CAP_LIABILITY)
+        strategies.append(_ADD_EXCLUSIONS)
+    
+    if monetary_value >= 100000:
+        strategies.append({
+            "priority": "High",
+            "strategy": "Obtain Liability Insurance",
+            "action": f"Secure professional liability insurance covering at least ${monetary_value:,.0f} to transfer risk.",
+            "rationale": "Insurance mitigates financial impact of indemnification claims."
+        })
+    
+    if "indemnif" in triggers_text:
+        strategies.append(_MUTUAL_INDEMNIFICATION)
+        strategies.append(_ADD_CARVE_OUTS)
+    
+    if severity == "High":
+        strategies.append(_LEGAL_REVIEW_REQUIRED)
+    
+    return strategies
+
+
+_ADD_NOTICE_PERIOD = MappingProxyType({
+    "priority": "Critical",
+    "strategy": "Add Notice Period",
+    "action": "Negotiate minimum 30-60 day notice period before termination becomes effective.",
+    "rationale": "Provides time to find replacement services or wind down operations."
+})
+
+_ADD_TERMINATION_FEE = MappingProxyType({
+    "priority": "High",
+    "strategy": "Add Termination Fee",
+    "action": "Require counterparty to pay termination fee (e.g., 3-6 months of fees) for convenience termination.",
+    "rationale": "Compensates for investment and planned revenue loss."
+})
+
+_REMOVE_UNILATERAL_RIGHT = MappingProxyType({
+    "priority": "High",
+    "strategy": "Remove Unilateral Right",
+    "action": "Make termination for convenience mutual (both parties have equal rights).",
+    "rationale": "Prevents one-sided termination advantage."
+})
+
+_ADD_CURE_PERIOD = MappingProxyType({
+    "priority": "Critical",
+    "strategy": "Add Cure Period",
+    "action": "Negotiate 30-day cure period for non-material breaches before termination.",
+    "rationale": "Provides opportunity to fix issues and preserve business relationship."
+})
+
+
+def _termination_strategies(
+    severity: str,
+    triggers_text: str,
+    monetary_value: float,
+    durations: Dict[str, int]
+) -> List[Mapping[str, str]]:
+    """Notice periods, termination fees, and cure periods."""
+    strategies = []
+    
+    if "immediate" in triggers_text:
+        strategies.append(_ADD_NOTICE_PERIOD)
+    
+    if "convenience" in triggers_text or "without cause" in triggers_text:
+        strategies.append(_ADD_TERMINATION_FEE)
+        strategies.append(_REMOVE_UNILATERAL_RIGHT)
+    
+    if "no cure" in triggers_text:
+        strategies.append(_ADD_CURE_PERIOD)
+    
+    notice_days = durations.get("notice_period_days", 0)
+    if notice_days > 0 and notice_days < 30:
+        strategies.append({
+            "priority": "Medium",
+            "strategy": "Extend Notice Period",
+            "action": f"Extend notice period from {notice_days} to 30-60 days.",
+            "rationale": "Short notice periods increase operational disruption risk."
+        })
+    
+    return strategies
+
+
+_IMPLEMENT_COMPLIANCE_PROGRAM = MappingProxyType({
+    "priority": "Critical",
+    "strategy": "Implement Compliance Program",
+    "action": "Establish GDPR/CCPA compliance program with data mapping, consent management, and breach response.",
+    "rationale": "Regulatory fines for non-compliance can reach millions of dollars."
+})
+
+_DATA_PROCESSING_AGREEMENT = MappingProxyType({
+    "priority": "High",
+    "strategy": "Data Processing Agreement",
+    "action": "Execute Data Processing Agreement (DPA) defining roles, responsibilities, and liability allocation.",
+    "rationale": "DPA clarifies processor vs. controller obligations and limits liability exposure."
+})
+
+_DATA_MINIMIZATION = MappingProxyType({
+    "priority": "High",
+    "strategy": "Data Minimization",
+    "action": "Collect and process only minimum PII necessary for contract performance.",
+    "rationale": "Reduces exposure to data breach liability and regulatory scrutiny."
+})
+
+_ENCRYPTION_ACCESS_CONTROLS = MappingProxyType({
+    "priority": "High",
+    "strategy": "Encryption & Access Controls",
+    "action": "Implement encryption at rest/in transit and role-based access controls for PII.",
+    "rationale": "Technical safeguards reduce breach risk and demonstrate compliance."
+})
+
+_INCIDENT_RESPONSE_PLAN = MappingProxyType({
+    "priority": "Critical",
+    "strategy": "Incident Response Plan",
+    "action": "Develop and test data breach incident response plan with notification procedures.",
+    "rationale": "Rapid breach response limits liability and regulatory penalties."
+})
+
+_CYBER_INSURANCE = MappingProxyType({
+    "priority": "Medium",
+    "strategy": "Cyber Insurance",
+    "action": "Obtain cyber liability insurance covering breach notification costs and regulatory fines.",
+    "rationale": "Transfers financial risk of data breaches and regulatory actions."
+})
+
+
+def _data_privacy_strategies(
+    severity: str,
+    triggers_text: str,
+    monetary_value: float,
+    durations: Dict[str, int]
+) -> List[Mapping[str, str]]:
+    """Compliance programs, data minimization, and breach response."""
+    strategies = []
+    
+    if "gdpr" in triggers_text or "ccpa" in triggers_text:
+        strategies.append(_IMPLEMENT_COMPLIANCE_PROGRAM)
+        strategies.append(_DATA_PROCESSING_AGREEMENT)
+    
+    if "pii" in triggers_text or "personal data" in triggers_text:
+        strategies.append(_DATA_MINIMIZATION)
+        strategies.append(_ENCRYPTION_ACCESS_CONTROLS)
+    
+    if "breach" in triggers_text:
+        strategies.append(_INCIDENT_RESPONSE_PLAN)
+        strategies.append(_CYBER_INSURANCE)
+    
+    return strategies
+
+
+_NEGOTIATE_REASONABLE_DAMAGES = MappingProxyType({
+    "priority": "High",
+    "strategy": "Negotiate Reasonable Damages",
+    "action": "Ensure liquidated damages are reasonable estimate of actual harm, not penalties.",
+    "rationale": "Excessive penalties may be unenforceable and create budget risk."
+})
+
+_ADD_PERFORMANCE_STANDARDS = MappingProxyType({
+    "priority": "Medium",
+    "strategy": "Add Performance Standards",
+    "action": "Define clear performance metrics and SLAs to avoid ambiguity in damages triggers.",
+    "rationale": "Clarity reduces disputes and unexpected penalty assessments."
+})
+
+_REDUCE_LATE_FEES = MappingProxyType({
+    "priority": "Medium",
+    "strategy": "Reduce Late Fees",
+    "action": "Cap late payment interest at prime rate + 2-3% (avoid excessive penalties).",
+    "rationale": "High interest rates compound financial impact of payment delays."
+})
+
+_GRACE_PERIOD = MappingProxyType({
+    "priority": "Medium",
+    "strategy": "Grace Period",
+    "action": "Negotiate 10-15 day grace period before late fees apply.",
+    "rationale": "Provides buffer for administrative delays without penalty."
+})
+
+
+def _payment_strategies(
+    severity: str,
+    triggers_text: str,
+    monetary_value: float,
+    durations: Dict[str, int]
+) -> List[Mapping[str, str]]:
+    """Reasonable damages, payment terms, and late-fee limits."""
+    strategies = []
+    
+    if "liquidated damages" in triggers_text or "penalty" in triggers_text:
+        strategies.append(_NEGOTIATE_REASONABLE_DAMAGES)
+        strategies.append(_ADD_PERFORMANCE_STANDARDS)
+    
+    if monetary_value >= 25000:
+        strategies.append({
+            "priority": "High",
+            "strategy": "Payment Terms Negotiation",
+            "action": f"Negotiate extended payment terms or milestone-based payments for ${monetary_value:,.0f}+.",
+            "rationale": "Reduces cash flow impact and aligns payments with value delivery."
+        })
+    
+    if "late" in triggers_text or "interest" in triggers_text:
+        strategies.append(_REDUCE_LATE_FEES)
+        strategies.append(_GRACE_PERIOD)
+    
+    return strategies
+
+
+_RETAIN_IP_OWNERSHIP = MappingProxyType({
+    "priority": "Critical",
+    "strategy": "Retain IP Ownership",
+    "action": "Negotiate to retain ownership of pre-existing IP and background IP.",
+    "rationale": "Prevents loss of core competitive assets and future business flexibility."
+})
+
+_GRANT_LIMITED_LICENSE = MappingProxyType({
+    "priority": "High",
+    "strategy": "Grant Limited License",
+    "action": "Instead of assignment, grant limited license to counterparty for contract purposes only.",
+    "rationale": "Maintains IP ownership while allowing necessary use."
+})
+
+_LIMIT_LICENSE_TERM = MappingProxyType({
+    "priority": "High",
+    "strategy": "Limit License Term",
+    "action": "Change perpetual license to term license tied to contract duration.",
+    "rationale": "Prevents permanent loss of control over IP monetization."
+})
+
+_ADD_REVERSION_RIGHTS = MappingProxyType({
+    "priority": "Medium",
+    "strategy": "Add Reversion Rights",
+    "action": "Include IP reversion clause if contract terminates or fees stop.",
+    "rationale": "Restores IP control if business relationship ends."
+})
+
+_IP_INDEMNIFICATION = MappingProxyType({
+    "priority": "High",
+    "strategy": "IP Indemnification",
+    "action": "Obtain IP indemnification from counterparty for their provided IP/technology.",
+    "rationale": "Transfers risk of third-party IP claims to the IP provider."
+})
+
+_IP_WARRANTY = MappingProxyType({
+    "priority": "Medium",
+    "strategy": "IP Warranty",
+    "action": "Require warranty that counterparty's IP does not infringe third-party rights.",
+    "rationale": "Provides contractual recourse for IP infringement claims."
+})
+
+_EXCLUDE_BACKGROUND_IP = MappingProxyType({
+    "priority": "Critical",
+    "strategy": "Exclude Background IP",
+    "action": "Clarify that only new work created specifically for this project is work-for-hire.",
+    "rationale": "Prevents loss of existing IP assets and reusable components."
+})
+
+
+def _ip_strategies(
+    severity: str,
+    triggers_text: str,
+    monetary_value: float,
+    durations: Dict[str, int]
+) -> List[Mapping[str, str]]:
+    """IP ownership, license scope, and infringement protection."""
+    strategies = []
+    
+    if "ownership" in triggers_text or "assignment" in triggers_text:
+        strategies.append(_RETAIN_IP_OWNERSHIP)
+        strategies.append(_GRANT_LIMITED_LICENSE)
+    
+    if "perpetual" in triggers_text or "irrevocable" in triggers_text:
+        strategies.append(_LIMIT_LICENSE_TERM)
+        strategies.append(_ADD_REVERSION_RIGHTS)
+    
+    if "infringement" in triggers_text:
+        strategies.append(_IP_INDEMNIFICATION)
+        strategies.append(_IP_WARRANTY)
+    
+    if "work for hire" in triggers_text:
+        strategies.append(_EXCLUDE_BACKGROUND_IP)
+    
+    return strategies
+
+
+# Label -> rule handler; each handler only sees its own category's triggers
+_LABEL_HANDLERS = {
+    "Liability Risk": _liability_strategies,
+    "Termination Risk": _termination_strategies,
+    "Data Privacy Risk": _data_privacy_strategies,
+    "Payment Risk": _payment_strategies,
+    "IP Risk": _ip_strategies,
+}
+
+
+_DOCUMENT_ASSUMPTIONS = MappingProxyType({
+    "priority": "Medium",
+    "strategy": "Document Assumptions",
+    "action": "Document business assumptions and risk acceptance in writing for future reference.",
+    "rationale": "Creates audit trail for risk decisions and facilitates future negotiations."
+})
+
+
+# Clauses in a contract (and boilerplate across contracts) often repeat the same
+# label/severity/trigger combination, so the rule engine output is memoized.
+_STRATEGY_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_STRATEGY_CACHE_SIZE)
+def _cached_strategies(
+    label: str,
+    severity: str,
+    risk_triggers: Tuple[str, ...],
+    monetary_value: float,
+    notice_days: int
+) -> Tuple[Mapping[str, str], ...]:
+    strategies = []
+    
+    handler = _LABEL_HANDLERS.get(label)
+    if handler is not None:
+        # Triggers are matched by substring, so lowercase and join them once up front
+        triggers_text = "\n".join(risk_triggers).lower()
+        # notice_period_days is the only duration the rules read
+        durations = {"notice_period_days": notice_days}
+        strategies = handler(severity, triggers_text, monetary_value, durations)
+    
+    # === GENERAL HIGH-SEVERITY MITIGATIONS ===
+    if severity == "High" and not strategies:
+        strategies.append({
+            "priority": "High",
+            "strategy": "Legal and Business Review",
+            "action": "Escalate to legal counsel and senior management for review and approval.",
+            "rationale": f"High-severity {label} requires expert evaluation before contract execution."
+        })
+        strategies.append(_DOCUMENT_ASSUMPTIONS)
+    
+    # Cached entries are handed to every caller, so freeze the per-call dicts too
+    return tuple(
+        strategy if isinstance(strategy, MappingProxyType) else MappingProxyType(strategy)
+        for strategy in strategies
+    )
 
 
 def generate_mitigation_strategies(
@@ -28,252 +418,18 @@ def generate_mitigation_strategies(
     Returns:
         List of mitigation strategies with priority and action items
     """
-    strategies = []
-    
     if durations is None:
         durations = {}
     
     # Skip neutral clauses
     if label == "Neutral" or severity == "None":
-        return strategies
-    
-    # === LIABILITY RISK MITIGATIONS ===
-    if label == "Liability Risk":
-        if any("uncapped" in trigger.lower() or "unlimited" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "Critical",
-                "strategy": "Cap Liability",
-                "action": "Negotiate a liability cap (e.g., 1x or 2x annual contract value) to limit maximum exposure.",
-                "rationale": "Uncapped liability creates unlimited financial risk. Industry standard is to cap at a multiple of fees paid."
-            })
-            strategies.append({
-                "priority": "Critical",
-                "strategy": "Add Exclusions",
-                "action": "Exclude liability for consequential, indirect, or punitive damages unless explicitly required.",
-                "rationale": "Consequential damages can far exceed direct contract value."
-            })
-        
-        if monetary_value >= 100000:
-            strategies.append({
-                "priority": "High",
-                "strategy": "Obtain Liability Insurance",
-                "action": f"Secure professional liability insurance covering at least ${monetary_value:,.0f} to transfer risk.",
-                "rationale": "Insurance mitigates financial impact of indemnification claims."
-            })
-        
-        if any("indemnif" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "High",
-                "strategy": "Mutual Indemnification",
-                "action": "Negotiate mutual indemnification obligations to balance risk between parties.",
-                "rationale": "One-sided indemnification creates asymmetric risk exposure."
-            })
-            strategies.append({
-                "priority": "Medium",
-                "strategy": "Add Carve-Outs",
-                "action": "Exclude indemnification for third-party claims arising from other party's actions or IP.",
-                "rationale": "Limits scope of indemnification to your direct actions only."
-            })
-        
-        if severity == "High":
-            strategies.append({
-                "priority": "High",
-                "strategy": "Legal Review Required",
-                "action": "Have legal counsel review liability provisions before signing.",
-                "rationale": "High-severity liability clauses require expert interpretation and negotiation."
-            })
-    
-    # === TERMINATION RISK MITIGATIONS ===
-    elif label == "Termination Risk":
-        if any("immediate" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "Critical",
-                "strategy": "Add Notice Period",
-                "action": "Negotiate minimum 30-60 day notice period before termination becomes effective.",
-                "rationale": "Provides time to find replacement services or wind down operations."
-            })
-        
-        if any("convenience" in trigger.lower() or "without cause" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "High",
-                "strategy": "Add Termination Fee",
-                "action": "Require counterparty to pay termination fee (e.g., 3-6 months of fees) for convenience termination.",
-                "rationale": "Compensates for investment and planned revenue loss."
-            })
-            strategies.append({
-                "priority": "High",
-                "strategy": "Remove Unilateral Right",
-                "action": "Make termination for convenience mutual (both parties have equal rights).",
-                "rationale": "Prevents one-sided termination advantage."
-            })
-        
-        if any("no cure" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "Critical",
-                "strategy": "Add Cure Period",
-                "action": "Negotiate 30-day cure period for non-material breaches before termination.",
-                "rationale": "Provides opportunity to fix issues and preserve business relationship."
-            })
-        
-        notice_days = durations.get("notice_period_days", 0)
-        if notice_days > 0 and notice_days < 30:
-            strategies.append({
-                "priority": "Medium",
-                "strategy": "Extend Notice Period",
-                "action": f"Extend notice period from {notice_days} to 30-60 days.",
-                "rationale": "Short notice periods increase operational disruption risk."
-            })
-    
-    # === DATA PRIVACY RISK MITIGATIONS ===
-    elif label == "Data Privacy Risk":
-        if any("gdpr" in trigger.lower() or "ccpa" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "Critical",
-                "strategy": "Implement Compliance Program",
-                "action": "Establish GDPR/CCPA compliance program with data mapping, consent management, and breach response.",
-                "rationale": "Regulatory fines for non-compliance can reach millions of dollars."
-            })
-            strategies.append({
-                "priority": "High",
-                "strategy": "Data Processing Agreement",
-                "action": "Execute Data Processing Agreement (DPA) defining roles, responsibilities, and liability allocation.",
-                "rationale": "DPA clarifies processor vs. controller obligations and limits liability exposure."
-            })
-        
-        if any("pii" in trigger.lower() or "personal data" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "High",
-                "strategy": "Data Minimization",
-                "action": "Collect and process only minimum PII necessary for contract performance.",
-                "rationale": "Reduces exposure to data breach liability and regulatory scrutiny."
-            })
-            strategies.append({
-                "priority": "High",
-                "strategy": "Encryption & Access Controls",
-                "action": "Implement encryption at rest/in transit and role-based access controls for PII.",
-                "rationale": "Technical safeguards reduce breach risk and demonstrate compliance."
-            })
-        
-        if any("breach" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "Critical",
-                "strategy": "Incident Response Plan",
-                "action": "Develop and test data breach incident response plan with notification procedures.",
-                "rationale": "Rapid breach response limits liability and regulatory penalties."
-            })
-            strategies.append({
-                "priority": "Medium",
-                "strategy": "Cyber Insurance",
-                "action": "Obtain cyber liability insurance covering breach notification costs and regulatory fines.",
-                "rationale": "Transfers financial risk of data breaches and regulatory actions."
-            })
-    
-    # === PAYMENT RISK MITIGATIONS ===
-    elif label == "Payment Risk":
-        if any("liquidated damages" in trigger.lower() or "penalty" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "High",
-                "strategy": "Negotiate Reasonable Damages",
-                "action": "Ensure liquidated damages are reasonable estimate of actual harm, not penalties.",
-                "rationale": "Excessive penalties may be unenforceable and create budget risk."
-            })
-            strategies.append({
-                "priority": "Medium",
-                "strategy": "Add Performance Standards",
-                "action": "Define clear performance metrics and SLAs to avoid ambiguity in damages triggers.",
-                "rationale": "Clarity reduces disputes and unexpected penalty assessments."
-            })
-        
-        if monetary_value >= 25000:
-            strategies.append({
-                "priority": "High",
-                "strategy": "Payment Terms Negotiation",
-                "action": f"Negotiate extended payment terms or milestone-based payments for ${monetary_value:,.0f}+.",
-                "rationale": "Reduces cash flow impact and aligns payments with value delivery."
-            })
-        
-        if any("late" in trigger.lower() or "interest" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "Medium",
-                "strategy": "Reduce Late Fees",
-                "action": "Cap late payment interest at prime rate + 2-3% (avoid excessive penalties).",
-                "rationale": "High interest rates compound financial impact of payment delays."
-            })
-            strategies.append({
-                "priority": "Medium",
-                "strategy": "Grace Period",
-                "action": "Negotiate 10-15 day grace period before late fees apply.",
-                "rationale": "Provides buffer for administrative delays without penalty."
-            })
-    
-    # === IP RISK MITIGATIONS ===
-    elif label == "IP Risk":
-        if any("ownership" in trigger.lower() or "assignment" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "Critical",
-                "strategy": "Retain IP Ownership",
-                "action": "Negotiate to retain ownership of pre-existing IP and background IP.",
-                "rationale": "Prevents loss of core competitive assets and future business flexibility."
-            })
-            strategies.append({
-                "priority": "High",
-                "strategy": "Grant Limited License",
-                "action": "Instead of assignment, grant limited license to counterparty for contract purposes only.",
-                "rationale": "Maintains IP ownership while allowing necessary use."
-            })
-        
-        if any("perpetual" in trigger.lower() or "irrevocable" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "High",
-                "strategy": "Limit License Term",
-                "action": "Change perpetual license to term license tied to contract duration.",
-                "rationale": "Prevents permanent loss of control over IP monetization."
-            })
-            strategies.append({
-                "priority": "Medium",
-                "strategy": "Add Reversion Rights",
-                "action": "Include IP reversion clause if contract terminates or fees stop.",
-                "rationale": "Restores IP control if business relationship ends."
-            })
-        
-        if any("infringement" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "High",
-                "strategy": "IP Indemnification",
-                "action": "Obtain IP indemnification from counterparty for their provided IP/technology.",
-                "rationale": "Transfers risk of third-party IP claims to the IP provider."
-            })
-            strategies.append({
-                "priority": "Medium",
-                "strategy": "IP Warranty",
-                "action": "Require warranty that counterparty's IP does not infringe third-party rights.",
-                "rationale": "Provides contractual recourse for IP infringement claims."
-            })
-        
-        if any("work for hire" in trigger.lower() for trigger in risk_triggers):
-            strategies.append({
-                "priority": "Critical",
-                "strategy": "Exclude Background IP",
-                "action": "Clarify that only new work created specifically for this project is work-for-hire.",
-                "rationale": "Prevents loss of existing IP assets and reusable components."
-            })
+        return []
     
-    # === GENERAL HIGH-SEVERITY MITIGATIONS ===
-    if severity == "High" and not strategies:
-        strategies.append({
-            "priority": "High",
-            "strategy": "Legal and Business Review",
-            "action": "Escalate to legal counsel and senior management for review and approval.",
-            "rationale": f"High-severity {label} requires expert evaluation before contract execution."
-        })
-        strategies.append({
-            "priority": "Medium",
-            "strategy": "Document Assumptions",
-            "action": "Document business assumptions and risk acceptance in writing for future reference.",
-            "rationale": "Creates audit trail for risk decisions and facilitates future negotiations."
-        })
-    
-    return strategies
+    # Hand out plain dict copies: the cached entries are shared read-only
+    # mappings, which JSON encoders reject
+    return [dict(strategy) for strategy in _cached_strategies(
+        label, severity, tuple(risk_triggers), monetary_value, durations.get("notice_period_days", 0)
+    )]
 
 
 def generate_executive_mitigation_summary(enriched_results: List[Dict[str, object]]) -> Dict[str, object]:
@@ -291,19 +447,33 @@ def generate_executive_mitigation_summary(enriched_results: List[Dict[str, objec
     critical_actions = []
     high_priority_actions = []
     recommended_reviews = []
+    high_risk_count = 0
+    liability_risk_count = 0
+    ip_risk_count = 0
     
-    # Collect mitigation strategies from all high/medium risk clauses
+    # Collect mitigation strategies from all high/medium risk clauses, tallying
+    # the review counts in the same pass
     for item in enriched_results:
         severity = item.get("severity", "None")
         if severity in ["High", "Medium"]:
             label = item.get("label", "")
-            risk_triggers = item.get("high_risk_detection", {}).get("risk_triggers", [])
-            monetary_value = item.get("extracted_metadata", {}).get("monetary_value", 0.0)
-            durations = item.get("extracted_metadata", {}).get("durations", {})
+            if severity == "High":
+                high_risk_count += 1
+            if label == "Liability Risk":
+                liability_risk_count += 1
+            elif label == "IP Risk":
+                ip_risk_count += 1
             
-            strategies = generate_mitigation_strategies(
-                label, severity, risk_triggers, monetary_value, durations
-            )
+            # Reuse strategies already attached per clause instead of re-deriving them
+            strategies = item.get("mitigation_strategies")
+            if strategies is None:
+                risk_triggers = item.get("high_risk_detection", {}).get("risk_triggers", [])
+                monetary_value = item.get("extracted_metadata", {}).get("monetary_value", 0.0)
+                durations = item.get("extracted_metadata", {}).get("durations", {})
+                
+                strategies = generate_mitigation_strategies(
+                    label, severity, risk_triggers, monetary_value, durations
+                )
             
             for strategy in strategies:
                 if strategy["priority"] == "Critical":
@@ -326,15 +496,12 @@ def generate_executive_mitigation_summary(enriched_results: List[Dict[str, objec
     high_priority_actions = deduplicate_strategies(high_priority_actions)
     
     # Generate recommended reviews
-    high_risk_count = sum(1 for item in enriched_results if item.get("severity") == "High")
     if high_risk_count > 0:
         recommended_reviews.append(f"Legal review required for {high_risk_count} high-severity clauses")
     
-    liability_risk_count = sum(1 for item in enriched_results if item.get("label") == "Liability Risk" and item.get("severity") in ["High", "Medium"])
     if liability_risk_count > 0:
         recommended_reviews.append(f"Risk management review for {liability_risk_count} liability clauses")
     
-    ip_risk_count = sum(1 for item in enriched_results if item.get("label") == "IP Risk" and item.get("severity") in ["High", "Medium"])
     if ip_risk_count > 0:
         recommended_reviews.append(f"IP counsel review for {ip_risk_count} intellectual property clauses")
     
@@ -1,5 +1,7 @@
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 
 IMPACT_WEIGHTS = {
 	"Liability Risk": 1.6,
@@ -23,27 +25,30 @@ def compute_severity_score(label: str, confidence: float) -> float:
 
 def attach_risk_scores(results: List[Dict[str, object]]) -> Tuple[List[Dict[str, object]], Dict[str, object]]:
 	"""Attach impact/likelihood severity scores and compute overall normalized score."""
-	updated = []
-	total_score = 0.0
-	max_possible = 0.0
-
-	for item in results:
-		label = str(item.get("label", "Neutral"))
-		confidence = float(item.get("confidence", 0.0))
-		impact = float(IMPACT_WEIGHTS.get(label, 1.0))
-		severity_score = compute_severity_score(label, confidence)
-
-		total_score += severity_score
-		max_possible += impact
-
-		updated.append(
-			{
-				**item,
-				"impact": impact,
-				"likelihood": round(confidence, 4),
-				"severity_score": severity_score,
-			}
-		)
+	count = len(results)
+	confidences = np.fromiter((float(item.get("confidence", 0.0)) for item in results), dtype=np.float64, count=count)
+	impacts = np.fromiter(
+		(IMPACT_WEIGHTS.get(str(item.get("label", "Neutral")), 1.0) for item in results),
+		dtype=np.float64,
+		count=count,
+	)
+
+	# impact x clipped likelihood for every clause at once; rounding stays on
+	# Python floats so scores match compute_severity_score exactly
+	severity_scores = [round(score, 4) for score in (impacts * np.clip(confidences, 0.0, 1.0)).tolist()]
+	impact_list = impacts.tolist()
+	total_score = sum(severity_scores, 0.0)
+	max_possible = sum(impact_list, 0.0)
+
+	updated = [
+		{
+			**item,
+			"impact": impact,
+			"likelihood": round(confidence, 4),
+			"severity_score": severity_score,
+		}
+		for item, impact, confidence, severity_score in zip(results, impact_list, confidences.tolist(), severity_scores)
+	]
 
 	normalized = round((total_score / max_possible) * 100, 2) if max_possible else 0.0
 
@@ -8,10 +8,13 @@ Splits raw contract text into individual clauses using:
 
 Returns only clauses longer than 20 characters after stripping whitespace.
 """
+import logging
 import re
 from typing import List
 
-from src.data_processing.cleaning import deduplicate_clauses
+from src.data_processing.cleaning import normalize_text
+
+logger = logging.getLogger(__name__)
 
 # ── Regex patterns ──────────────────────────────────────────────────
 # Matches lines that start with a numbered heading like  1.  /  1.1  /  (a)
@@ -30,9 +33,19 @@ _SENTENCE_BOUNDARY = re.compile(
     r"(?<=[.!?])\s+(?=[A-Z])"
 )
 
-_OCR_NOISE_PATTERN = re.compile(r"\b(?:l\s*\/\s*I|I\s*\/\s*l|\|{2,}|_{2,})\b")
+# The leading lookahead lets the scanner skip positions that cannot start a match
+_OCR_NOISE_PATTERN = re.compile(r"(?=[lI|_])\b(?:l\s*\/\s*I|I\s*\/\s*l|\|{2,}|_{2,})\b")
 _MULTI_DOT_PATTERN = re.compile(r"\.{3,}")
+# Runs of spaces/tabs and lone tabs; single spaces are already normalized
+_HORIZONTAL_SPACE_PATTERN = re.compile(r"[ \t]{2,}|\t")
+_EXCESS_NEWLINES_PATTERN = re.compile(r"\n{3,}")
 _ARTIFACT_PREFIX_PATTERN = re.compile(r"^(?:\d+[\.)]|\(?[a-zA-Z]\)|[ivxlcdm]+\.)\s*$", re.IGNORECASE)
+# Leading outline numbering: any run of "1." / "1.1" markers, then at most one "(a)" / "(iv)"
+_LEADING_NUMBERING_PATTERN = re.compile(
+    r"^(?:\d+(?:\.\d+)*\.?\s+)*(?:\((?:[a-z]|[ivxlcdm]+)\)\s+)?",
+    re.IGNORECASE,
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
 def normalize_contract_text(text: str) -> str:
@@ -41,18 +54,16 @@ def normalize_contract_text(text: str) -> str:
     normalized = normalized.replace("\x0c", " ")
     normalized = _OCR_NOISE_PATTERN.sub(" ", normalized)
     normalized = _MULTI_DOT_PATTERN.sub(".", normalized)
-    normalized = re.sub(r"[ \t]+", " ", normalized)
-    normalized = "\n".join(line.strip() for line in normalized.splitlines())
-    normalized = re.sub(r"\n{3,}", "\n\n", normalized)
+    normalized = _HORIZONTAL_SPACE_PATTERN.sub(" ", normalized)
+    normalized = "\n".join(map(str.strip, normalized.splitlines()))
+    normalized = _EXCESS_NEWLINES_PATTERN.sub("\n\n", normalized)
     return normalized.strip()
 
 
 def _clean_clause_artifacts(clause: str) -> str:
     """Remove numbering/outline artifacts left after segmentation."""
-    cleaned = clause.strip()
-    cleaned = re.sub(r"^\s*(?:\d+(?:\.\d+)*\.?\s+)+", "", cleaned)
-    cleaned = re.sub(r"^\s*\(([a-z]|[ivxlcdm]+)\)\s+", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s+", " ", cleaned)
+    cleaned = _LEADING_NUMBERING_PATTERN.sub("", clause.strip(), count=1)
+    cleaned = _WHITESPACE_PATTERN.sub(" ", cleaned)
     return cleaned.strip()
 
 
@@ -64,7 +75,7 @@ def segment_clauses(text: str, min_length: int = 20) -> List[str]:
       1. Split on numbered-section headings.
       2. Split each fragment on semicolons.
       3. Split remaining fragments on sentence boundaries.
-      4. Keep only clauses with len > min_length.
+      4. Keep only clauses with len > min_length, dropping repeats.
 
     Args:
         text:       The full raw contract text (ideally from pdf_extractor).
@@ -79,31 +90,34 @@ def segment_clauses(text: str, min_length: int = 20) -> List[str]:
     text = normalize_contract_text(text)
 
     # ── Step 1: split on numbered section headings ─────────────────
-    # Insert a unique delimiter before each section marker
-    delimited = _SECTION_PATTERN.sub(r"\n<SPLIT>\g<0>", text)
-    fragments = delimited.split("<SPLIT>")
-
-    # ── Step 2: split on semicolons ────────────────────────────────
-    semi_fragments = []
-    for frag in fragments:
-        semi_fragments.extend(frag.split(";"))
-
-    # ── Step 3: split on sentence boundaries ───────────────────────
-    clauses = []
-    for frag in semi_fragments:
-        parts = _SENTENCE_BOUNDARY.split(frag)
-        clauses.extend(parts)
-
-    # ── Step 4: clean and filter ───────────────────────────────────
-    cleaned = []
-    for clause in clauses:
-        c = _clean_clause_artifacts(clause)
-        if _ARTIFACT_PREFIX_PATTERN.match(c):
-            continue
-        if len(c) > min_length:
-            cleaned.append(c)
+    # Each section runs from its heading marker to the next one
+    starts = [match.start() for match in _SECTION_PATTERN.finditer(text)]
+    bounds = zip([0] + starts, starts + [len(text)])
+
+    # ── Steps 2-4: semicolons, sentence boundaries, clean + filter ─
+    # Duplicates (by normalized text) are dropped as clauses are produced
+    seen = set()
+    unique = []
+    removed = 0
+    for start, end in bounds:
+        for frag in text[start:end].split(";"):
+            for clause in _SENTENCE_BOUNDARY.split(frag):
+                c = _clean_clause_artifacts(clause)
+                # Length first: short fragments are dropped without a regex call
+                if len(c) <= min_length or _ARTIFACT_PREFIX_PATTERN.fullmatch(c):
+                    continue
+                key = normalize_text(c)
+                if not key:
+                    continue
+                if key in seen:
+                    removed += 1
+                    continue
+                seen.add(key)
+                unique.append(c)
+
+    if removed:
+        logger.info("Removed %s duplicate clauses during cleaning", removed)
 
-    unique, _ = deduplicate_clauses(cleaned)
     return unique
 
 
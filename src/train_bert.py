@@ -1,68 +1,148 @@
 import pandas as pd
 import numpy as np
+import hashlib
 import os
 import torch
 import argparse
+from typing import Dict, List, NamedTuple, Optional
 from torch import nn
+from torch.nn import functional as F
+from torch.nn.utils.rnn import pad_sequence
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import f1_score, accuracy_score, classification_report
+from sklearn.metrics import classification_report
 from transformers import (
     AutoTokenizer, 
     AutoModelForSequenceClassification, 
     Trainer, 
-    TrainingArguments, 
-    DataCollatorWithPadding
+    TrainingArguments
 )
-from sklearn.utils.class_weight import compute_class_weight
 
 # Set seed for reproducibility
 torch.manual_seed(42)
 
+TOKENIZED_CACHE_DIR = os.path.join('data', '_cache')
+# FP16/BF16 tensor-core GEMMs need dimensions divisible by 8; others take the slow path
+TENSOR_CORE_MULTIPLE = 8
+
 class ClauseDataset(torch.utils.data.Dataset):
     def __init__(self, encodings, labels):
-        self.encodings = encodings
-        self.labels = labels
+        # Encodings are padded to a common length, so convert each field to one
+        # tensor up front; __getitem__ then only takes row views. Ids fit in int32,
+        # which halves host memory and host-to-device copies; the trainer widens on device
+        self.encodings = {key: torch.as_tensor(val, dtype=torch.int32) for key, val in encodings.items()}
+        self.labels = torch.as_tensor(labels, dtype=torch.long)
+        # Unpadded token counts (padding is on the right)
+        self.lengths = self.encodings['attention_mask'].sum(dim=1).tolist()
 
     def __getitem__(self, idx):
-        item = {key: torch.tensor(val[idx]) for key, val in self.encodings.items()}
-        item['labels'] = torch.tensor(self.labels[idx])
+        # Trim each row to its own length so batches are padded only to their longest clause
+        length = self.lengths[idx]
+        item = {key: val[idx, :length] for key, val in self.encodings.items()}
+        item['labels'] = self.labels[idx]
         return item
 
     def __len__(self):
         return len(self.labels)
 
+class ClauseCollator:
+    """Pad a batch of trimmed int32 rows to its longest clause, keeping int32."""
+
+    def __init__(self, pad_token_id: int, pad_to_multiple_of: int = TENSOR_CORE_MULTIPLE):
+        self.pad_token_id = pad_token_id
+        self.pad_to_multiple_of = pad_to_multiple_of
+
+    def __call__(self, features):
+        batch = {'labels': torch.stack([feature['labels'] for feature in features])}
+        for key in features[0]:
+            if key == 'labels':
+                continue
+            pad_value = self.pad_token_id if key == 'input_ids' else 0
+            # One native call per field instead of a copy per sample
+            padded = pad_sequence([feature[key] for feature in features], batch_first=True, padding_value=pad_value)
+            # Round up so tensor-core GEMMs see aligned sequence lengths, whatever
+            # length group_by_length gives this batch
+            extra = -padded.shape[1] % self.pad_to_multiple_of
+            batch[key] = F.pad(padded, (0, extra), value=pad_value) if extra else padded
+        return batch
+
 class WeightedTrainer(Trainer):
     def __init__(self, class_weights, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.class_weights = torch.tensor(class_weights).to(self.args.device)
+        self.loss_fct = nn.CrossEntropyLoss(weight=self.class_weights)
 
     def compute_loss(self, model, inputs, return_outputs=False, **kwargs):
+        # Batches arrive as int32 (see ClauseCollator); widen to int64 on device
+        inputs = {key: val.long() for key, val in inputs.items()}
         labels = inputs.get("labels")
         outputs = model(**inputs)
-        logits = outputs.get("logits")
-        loss_fct = nn.CrossEntropyLoss(weight=self.class_weights)
-        loss = loss_fct(logits.view(-1, self.model.config.num_labels), labels.view(-1))
+        # Classification logits are already (batch, num_labels) and labels (batch,)
+        loss = self.loss_fct(outputs.get("logits"), labels)
         return (loss, outputs) if return_outputs else loss
 
+def tokenize_corpus(tokenizer, base_model_name: str, texts, max_len: int):
+    """
+    Tokenize texts to padded NumPy arrays, reusing the copy saved by an earlier
+    run with the same tokenizer, max_len, and texts.
+    """
+    digest = hashlib.blake2b("\x00".join(texts).encode("utf-8"), digest_size=16).hexdigest()
+    cache_name = f"{base_model_name.replace('/', '__')}_{max_len}_{digest}.npz"
+    cache_path = os.path.join(TOKENIZED_CACHE_DIR, cache_name)
+    if os.path.exists(cache_path):
+        print(f"Loading cached tokenization from {cache_path}...")
+        with np.load(cache_path) as cached:
+            return {key: cached[key] for key in cached.files}
+
+    encodings = {
+        key: val.astype(np.int32)
+        for key, val in tokenizer(texts, truncation=True, padding=True, max_length=max_len, return_tensors="np").items()
+    }
+    os.makedirs(TOKENIZED_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        np.savez(handle, **encodings)
+    os.replace(tmp_path, cache_path)
+    return encodings
+
 def compute_metrics(pred):
-    labels = pred.label_ids
+    labels = np.asarray(pred.label_ids, dtype=np.int64)
     preds = pred.predictions.argmax(-1)
-    f1 = f1_score(labels, preds, average='weighted')
-    acc = accuracy_score(labels, preds)
+    # Both metrics from one confusion matrix; same values as sklearn's
+    # accuracy_score and f1_score(average='weighted') with zero_division=0
+    n_classes = pred.predictions.shape[-1]
+    cm = np.bincount(labels * n_classes + preds, minlength=n_classes * n_classes).reshape(n_classes, n_classes)
+    tp = np.diag(cm)
+    support = cm.sum(axis=1)
+    # Per-class F1 = 2TP / (2TP + FP + FN) = 2TP / (support + predicted count)
+    denom = support + cm.sum(axis=0)
+    per_class_f1 = np.divide(2 * tp, denom, out=np.zeros(n_classes), where=denom > 0)
+    f1 = float(per_class_f1 @ support / support.sum())
+    acc = float(tp.sum() / cm.sum())
     return {
         'accuracy': acc,
         'f1': f1,
     }
 
-def train_transformer_model(base_model_name: str, model_output_dir: str):
-    input_file = 'data/cuad_with_risk.csv'
-    
+class TrainingData(NamedTuple):
+    """Model-independent training inputs, shared by every base model."""
+    texts: List[str]
+    train_idx: np.ndarray
+    val_idx: np.ndarray
+    train_labels: np.ndarray
+    val_labels: np.ndarray
+    unique_labels: List[str]
+    label2id: Dict[str, int]
+    id2label: Dict[int, str]
+    class_weights: np.ndarray
+
+def prepare_training_data(input_file: str = 'data/cuad_with_risk.csv') -> Optional[TrainingData]:
+    """Load, subsample, label-encode, and split the labelled clauses (None if the CSV is missing)."""
     if not os.path.exists(input_file):
         print(f"Error: {input_file} not found.")
-        return
+        return None
 
     print(f"Loading data from {input_file}...")
-    df = pd.read_csv(input_file).dropna(subset=['clause_text', 'risk_label'])
+    df = pd.read_csv(input_file, usecols=['clause_text', 'risk_label']).dropna(subset=['clause_text', 'risk_label'])
     
     # Subsetting for CPU training speed
     if not torch.cuda.is_available() and len(df) > 400:
@@ -73,38 +153,69 @@ def train_transformer_model(base_model_name: str, model_output_dir: str):
             samples.append(subset.sample(min(len(subset), 80), random_state=42))
         df = pd.concat(samples).reset_index(drop=True)
     
-    # Label Encoding
-    unique_labels = sorted(df['risk_label'].unique())
+    # Label Encoding: one factorize pass; categories come out sorted, so ids match sorted(unique)
+    categorical = pd.Categorical(df['risk_label'])
+    unique_labels = list(categorical.categories)
     label2id = {label: i for i, label in enumerate(unique_labels)}
     id2label = {i: label for label, i in label2id.items()}
-    df['label'] = df['risk_label'].map(label2id)
-    
-    # Class Weights
-    class_weights = compute_class_weight(
-        class_weight='balanced',
-        classes=np.unique(df['label']),
-        y=df['label']
-    ).astype(np.float32)
-    
-    # Split
-    train_texts, val_texts, train_labels, val_labels = train_test_split(
-        df['clause_text'].tolist(), 
-        df['label'].tolist(), 
+    labels = categorical.codes.astype(np.int64)
+    
+    # Class Weights ('balanced': n_samples / (n_classes * count)); codes are 0..n_classes-1
+    counts = np.bincount(labels, minlength=len(unique_labels))
+    class_weights = (len(df) / (len(unique_labels) * counts)).astype(np.float32)
+    
+    # Split row indices; the split is the same one train_test_split gives for the lists
+    train_idx, val_idx = train_test_split(
+        np.arange(len(df)), 
         test_size=0.2, 
         random_state=42, 
-        stratify=df['label']
+        stratify=labels
+    )
+    
+    return TrainingData(
+        texts=df['clause_text'].tolist(),
+        train_idx=train_idx,
+        val_idx=val_idx,
+        train_labels=labels[train_idx],
+        val_labels=labels[val_idx],
+        unique_labels=unique_labels,
+        label2id=label2id,
+        id2label=id2label,
+        class_weights=class_weights,
     )
+
+def train_transformer_model(
+    base_model_name: str,
+    model_output_dir: str,
+    compile_model: bool = False,
+    data: Optional[TrainingData] = None,
+):
+    # Pass ``data`` from prepare_training_data to reuse it across base models
+    if data is None:
+        data = prepare_training_data()
+        if data is None:
+            return
+    unique_labels, label2id, id2label = data.unique_labels, data.label2id, data.id2label
+    class_weights = data.class_weights
+    train_labels, val_labels = data.train_labels, data.val_labels
     
     print(f"Initializing Tokenizer ({base_model_name})...")
-    tokenizer = AutoTokenizer.from_pretrained(base_model_name)
+    tokenizer = AutoTokenizer.from_pretrained(base_model_name, use_fast=True)
     
     max_len = 128 if not torch.cuda.is_available() else 512
     print(f"Tokenizing (max_length={max_len})...")
-    train_encodings = tokenizer(train_texts, truncation=True, padding=True, max_length=max_len)
-    val_encodings = tokenizer(val_texts, truncation=True, padding=True, max_length=max_len)
+    # One batch (Rust) tokenizer call straight to padded NumPy arrays (cached on
+    # disk across runs), sliced into train/val; ClauseDataset trims rows back to
+    # their true lengths
+    encodings = tokenize_corpus(tokenizer, base_model_name, data.texts, max_len)
+    train_encodings = {key: val[data.train_idx] for key, val in encodings.items()}
+    val_encodings = {key: val[data.val_idx] for key, val in encodings.items()}
     
     train_dataset = ClauseDataset(train_encodings, train_labels)
     val_dataset = ClauseDataset(val_encodings, val_labels)
+    # The datasets share memory with the sliced arrays; drop the full padded
+    # corpus before the model weights are allocated
+    del encodings, train_encodings, val_encodings
     
     print("Loading Model...")
     model = AutoModelForSequenceClassification.from_pretrained(
@@ -117,14 +228,29 @@ def train_transformer_model(base_model_name: str, model_output_dir: str):
     # Determine batch size based on GPU availability
     device = "cuda" if torch.cuda.is_available() else "cpu"
     batch_size = 8 if device == "cuda" else 4
-    print(f"Using device: {device}, Batch size: {batch_size}")
+    # On GPU, accumulate to an effective batch of 32 (the usual BERT fine-tuning
+    # size); the subsampled CPU run is too short to give up optimizer steps
+    grad_accum_steps = 4 if device == "cuda" else 1
+    print(f"Using device: {device}, Batch size: {batch_size} (x{grad_accum_steps} accumulation)")
     
     num_epochs = 2 if not torch.cuda.is_available() else 3
+    # BF16 keeps FP32's exponent range (no loss scaling) on Ampere+; older GPUs fall back to FP16
+    use_bf16 = torch.cuda.is_available() and torch.cuda.is_bf16_supported()
     training_args = TrainingArguments(
         output_dir='./results',
         num_train_epochs=num_epochs,
         per_device_train_batch_size=batch_size,
-        per_device_eval_batch_size=batch_size,
+        # No activations are kept for backward during evaluation, so eval batches can be much larger
+        per_device_eval_batch_size=64 if device == "cuda" else 32,
+        gradient_accumulation_steps=grad_accum_steps,
+        # Samples are ready-made tensor views, so load in-process; on GPU, pin them
+        # and let the host-to-device copy run asynchronously
+        dataloader_pin_memory=torch.cuda.is_available(),
+        accelerator_config={"non_blocking": torch.cuda.is_available()},
+        # Batch clauses of similar length together; attention cost grows with the padded length
+        group_by_length=True,
+        # Single fused CUDA kernel for the AdamW update instead of per-parameter ops
+        optim="adamw_torch_fused" if torch.cuda.is_available() else "adamw_torch",
         warmup_steps=100,
         weight_decay=0.01,
         logging_dir='./logs',
@@ -133,7 +259,12 @@ def train_transformer_model(base_model_name: str, model_output_dir: str):
         save_strategy="epoch",
         load_best_model_at_end=True,
         metric_for_best_model="f1",
-        fp16=torch.cuda.is_available(),
+        bf16=use_bf16,
+        fp16=torch.cuda.is_available() and not use_bf16,
+        # Opt-in TorchInductor compile; the first steps pay the compile cost.
+        # CUDA graphs ("reduce-overhead") cut launch overhead at these small batch sizes.
+        torch_compile=compile_model,
+        torch_compile_mode="reduce-overhead" if compile_model and torch.cuda.is_available() else None,
         report_to="none"
     )
     
@@ -144,6 +275,8 @@ def train_transformer_model(base_model_name: str, model_output_dir: str):
         train_dataset=train_dataset,
         eval_dataset=val_dataset,
         processing_class=tokenizer,
+        # Pad each batch to its longest clause (rounded up for tensor cores)
+        data_collator=ClauseCollator(tokenizer.pad_token_id),
         compute_metrics=compute_metrics,
     )
     
@@ -151,11 +284,14 @@ def train_transformer_model(base_model_name: str, model_output_dir: str):
     trainer.train()
     
     print("Evaluating...")
-    eval_results = trainer.evaluate()
+    # One pass over the validation set gives both the metrics and the predictions
+    # for the report (a separate evaluate() would run the same forward passes again)
+    with torch.inference_mode():
+        preds = trainer.predict(val_dataset, metric_key_prefix="eval")
+    eval_results = preds.metrics
     print(f"\nFinal Evaluation Results: {eval_results}")
     
     # Final classification report
-    preds = trainer.predict(val_dataset)
     y_pred = preds.predictions.argmax(-1)
     print("\n--- BERT Classification Report ---")
     print(classification_report(val_labels, y_pred, target_names=unique_labels))
@@ -167,16 +303,26 @@ def train_transformer_model(base_model_name: str, model_output_dir: str):
     print("Model saved successfully.")
 
 
-def train_bert_and_legal_bert(train_both: bool = True):
+def train_bert_and_legal_bert(train_both: bool = True, compile_model: bool = False):
+    # Loading, subsampling, label encoding and the split do not depend on the
+    # base model, so do them once; only tokenization is per model (own vocab)
+    data = prepare_training_data()
+    if data is None:
+        return
+
     train_transformer_model(
         base_model_name="bert-base-uncased",
         model_output_dir="models/bert_model",
+        compile_model=compile_model,
+        data=data,
     )
 
     if train_both:
         train_transformer_model(
             base_model_name="nlpaueb/legal-bert-base-uncased",
             model_output_dir="models/legal_bert_model",
+            compile_model=compile_model,
+            data=data,
         )
 
 
@@ -188,13 +334,18 @@ def parse_args():
         default="both",
         help="Select which model(s) to train.",
     )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile the model with torch.compile before training.",
+    )
     return parser.parse_args()
 
 if __name__ == "__main__":
     args = parse_args()
     if args.model == "bert":
-        train_transformer_model("bert-base-uncased", "models/bert_model")
+        train_transformer_model("bert-base-uncased", "models/bert_model", compile_model=args.compile)
     elif args.model == "legal-bert":
-        train_transformer_model("nlpaueb/legal-bert-base-uncased", "models/legal_bert_model")
+        train_transformer_model("nlpaueb/legal-bert-base-uncased", "models/legal_bert_model", compile_model=args.compile)
     else:
-        train_bert_and_legal_bert(train_both=True)
+        train_bert_and_legal_bert(train_both=True, compile_model=args.compile)